@@ -26,6 +26,26 @@ def clean():
             if f.endswith('.pyc'):
                 os.remove(os.path.join(root, f))
 
+    # Clean mypyc extension modules built next to the sources
+    for root, dirs, files in os.walk('src'):
+        for f in files:
+            if f.endswith(('.so', '.pyd')):
+                os.remove(os.path.join(root, f))
+    for f in os.listdir('.'):
+        if f.endswith(('.so', '.pyd')) and '__mypyc' in f:
+            os.remove(f)
+
+
+# Pure-Python hot paths compiled ahead of time with mypyc (see `compile`)
+MYPYC_MODULES = [
+    'src/controllers/mld_transformer.py',
+    'src/models/attribute.py',
+    'src/models/entity.py',
+    'src/models/association.py',
+    'src/models/link.py',
+    'src/models/mld.py',
+]
+
 
 def _ensure_pyinstaller():
     """Ensure PyInstaller is installed."""
@@ -36,6 +56,29 @@ def _ensure_pyinstaller():
         subprocess.run([sys.executable, '-m', 'pip', 'install', 'pyinstaller'])
 
 
+def compile_modules():
+    """Compile the model and MLD modules in place with mypyc.
+
+    The resulting extension modules sit next to the .py files and take
+    precedence at import time; `clean` removes them again.
+    """
+    try:
+        import mypyc
+    except ImportError:
+        print("mypyc not found. Installing...")
+        subprocess.run([sys.executable, '-m', 'pip', 'install', 'mypy'])
+
+    cmd = [sys.executable, '-m', 'mypyc'] + MYPYC_MODULES
+    print(f"Running: {' '.join(cmd)}")
+    result = subprocess.run(cmd)
+
+    if result.returncode == 0:
+        print("\nCompilation successful!")
+    else:
+        print("Compilation failed!")
+        sys.exit(1)
+
+
 def build():
     """Build the GUI application."""
     system = platform.system().lower()
@@ -192,6 +235,8 @@ if __name__ == '__main__':
             build_cli()
         elif cmd == 'build-all':
             build_all()
+        elif cmd == 'compile':
+            compile_modules()
         elif cmd == 'ico':
             create_windows_ico()
         elif cmd == 'install-man':
@@ -200,6 +245,6 @@ if __name__ == '__main__':
             uninstall_man()
         else:
             print(f"Unknown command: {cmd}")
-            print("Usage: python build.py [clean|build|build-cli|build-all|ico|install-man|uninstall-man]")
+            print("Usage: python build.py [clean|build|build-cli|build-all|compile|ico|install-man|uninstall-man]")
     else:
         build_all()
@@ -64,18 +64,17 @@ def cmd_sql(args):
 
     project = load_project(args.file)
     generator = SQLGenerator(project)
-    sql = generator.generate()
 
     if args.output:
         try:
             with open(args.output, "w", encoding="utf-8") as f:
-                f.write(sql)
+                f.writelines(generator.generate_iter())
             print(f"SQL written to {args.output}")
         except OSError as e:
             print(f"Error writing file: {e}", file=sys.stderr)
             sys.exit(2)
     else:
-        print(sql)
+        print(generator.generate())
 
 
 def cmd_mld(args):
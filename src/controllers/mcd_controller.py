@@ -12,41 +12,37 @@ class MCDController:
         errors = []
 
         # Check for entities
-        entities = self._project.get_all_entities()
+        entities = self._project.iter_entities()
         if not entities:
             errors.append("No entities defined. Add at least one entity.")
 
-        # Check entities have at least one primary key
+        # Single pass over entities: primary key check now, orphan check
+        # (no links) reported after the association checks
+        orphan_errors = []
         for entity in entities:
-            has_pk = any(attr.is_primary_key for attr in entity.attributes)
+            has_pk = any(attr.is_primary_key for attr in entity.iter_attributes())
             if not has_pk:
                 errors.append(f"Entity '{entity.name}' has no primary key attribute.")
+            if not self._project.get_links_for_entity(entity.id):
+                orphan_errors.append(f"Entity '{entity.name}' is not connected to any association.")
 
         # Check associations have at least 2 links
-        for assoc in self._project.get_all_associations():
+        for assoc in self._project.iter_associations():
             links = self._project.get_links_for_association(assoc.id)
             if len(links) < 2:
                 errors.append(
                     f"Association '{assoc.name}' must be connected to at least 2 entities."
                 )
 
-        # Check for orphan entities (no links)
-        for entity in self._project.get_all_entities():
-            links = self._project.get_links_for_entity(entity.id)
-            if len(links) == 0:
-                errors.append(f"Entity '{entity.name}' is not connected to any association.")
+        errors.extend(orphan_errors)
 
         return errors
 
     def get_statistics(self) -> dict:
         """Get statistics about the current model."""
-        # Count all attributes across all entities
-        total_attributes = sum(
-            len(entity.attributes) for entity in self._project.get_all_entities()
-        )
         return {
-            "attributes": total_attributes,
-            "entities": len(self._project.get_all_entities()),
-            "associations": len(self._project.get_all_associations()),
-            "links": len(self._project.get_all_links())
+            "attributes": self._project.attribute_count(),
+            "entities": self._project.entity_count(),
+            "associations": self._project.association_count(),
+            "links": self._project.link_count()
         }
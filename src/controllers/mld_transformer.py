@@ -1,8 +1,44 @@
-from typing import List
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, List
 from ..models.project import Project
+from ..models.attribute import Attribute
+from ..models.entity import Entity
+from ..models.association import Association
+from ..models.link import Link
 from ..models.mld import MLDTable, MLDColumn
 
 
+# Anything that is not alphanumeric or underscore (Unicode-aware, like str.isalnum)
+_UNSAFE_CHARS = re.compile(r"\W+")
+
+
+def _build_ascii_safe_table() -> Dict[int, str | None]:
+    """Single-pass table for ASCII names: lowercase, map space/dash to "_", drop the rest."""
+    table: Dict[int, str | None] = {}
+    for code in range(128):
+        char = chr(code)
+        if char in " -":
+            table[code] = "_"
+        elif char.isalnum() or char == "_":
+            table[code] = char.lower()
+        else:
+            table[code] = None
+    return table
+
+
+_ASCII_SAFE_TABLE = _build_ascii_safe_table()
+
+
+@lru_cache(maxsize=4096)
+def _safe_name(name: str) -> str:
+    """Convert name to safe SQL identifier (cached and interned, names repeat across columns)."""
+    if name.isascii():
+        return sys.intern(name.translate(_ASCII_SAFE_TABLE))
+    return sys.intern(_UNSAFE_CHARS.sub("", name.lower().replace(" ", "_").replace("-", "_")))
+
+
 class MLDTransformer:
     """Transforms MCD (Conceptual Data Model) to MLD (Logical Data Model)."""
 
@@ -11,36 +47,41 @@ class MLDTransformer:
 
     def transform(self) -> List[MLDTable]:
         """Transform the MCD to a list of MLD tables."""
-        tables = []
+        tables: List[MLDTable] = []
+
+        # Primary keys and table names are reused for every FK pointing at an entity
+        entities = self._project.get_all_entities()
+        pk_cache: Dict[str, List[Attribute]] = {e.id: e.get_primary_keys() for e in entities}
+        safe_entity_names: Dict[str, str] = {e.id: _safe_name(e.name) for e in entities}
 
         # Transform entities to tables
-        for entity in self._project.get_all_entities():
-            table = self._transform_entity(entity)
+        for entity in entities:
+            table = self._transform_entity(entity, safe_entity_names)
             tables.append(table)
 
         # Transform N-N associations to junction tables
-        for assoc in self._project.get_all_associations():
-            table = self._transform_association(assoc)
-            if table:
-                tables.append(table)
+        for assoc in self._project.iter_associations():
+            junction = self._transform_association(assoc, pk_cache, safe_entity_names)
+            if junction:
+                tables.append(junction)
 
         # Add foreign keys for 1-N relationships
-        self._add_foreign_keys(tables)
+        self._add_foreign_keys(tables, entities, pk_cache, safe_entity_names)
 
         return tables
 
-    def _transform_entity(self, entity) -> MLDTable:
+    def _transform_entity(self, entity: Entity, safe_entity_names: Dict[str, str]) -> MLDTable:
         """Transform an entity to an MLD table."""
         table = MLDTable(
-            name=self._safe_name(entity.name),
+            name=safe_entity_names[entity.id],
             source_type="entity",
             source_id=entity.id
         )
 
         # Add columns from entity attributes
-        for attr in entity.attributes:
+        for attr in entity.iter_attributes():
             column = MLDColumn(
-                name=self._safe_name(attr.name),
+                name=_safe_name(attr.name),
                 data_type=attr.get_sql_type(),
                 is_primary_key=attr.is_primary_key,
                 is_nullable=not attr.is_primary_key
@@ -49,7 +90,10 @@ class MLDTransformer:
 
         return table
 
-    def _transform_association(self, assoc) -> MLDTable | None:
+    def _transform_association(
+        self, assoc: Association, pk_cache: Dict[str, List[Attribute]],
+        safe_entity_names: Dict[str, str]
+    ) -> MLDTable | None:
         """Transform an association to a junction table if needed."""
         links = self._project.get_links_for_association(assoc.id)
 
@@ -60,31 +104,34 @@ class MLDTransformer:
         n_links = [link for link in links if link.cardinality_max == "N"]
 
         if len(n_links) >= 2 or assoc.has_attributes():
-            return self._create_junction_table(assoc, links)
+            return self._create_junction_table(assoc, links, pk_cache, safe_entity_names)
 
         return None
 
-    def _create_junction_table(self, assoc, links) -> MLDTable:
+    def _create_junction_table(
+        self, assoc: Association, links: List[Link], pk_cache: Dict[str, List[Attribute]],
+        safe_entity_names: Dict[str, str]
+    ) -> MLDTable:
         """Create a junction table for N-N relationships."""
         table = MLDTable(
-            name=self._safe_name(assoc.name),
+            name=_safe_name(assoc.name),
             source_type="association",
             source_id=assoc.id
         )
 
         # Add foreign key columns for each linked entity
         for link in links:
-            entity = self._project.get_entity(link.entity_id)
-            if entity:
-                for pk_attr in entity.get_primary_keys():
-                    col_name = f"fk_{self._safe_name(entity.name)}_{pk_attr.name}"
+            if link.entity_id in pk_cache:
+                entity_name = safe_entity_names[link.entity_id]
+                for pk_attr in pk_cache[link.entity_id]:
+                    col_name = sys.intern(f"fk_{entity_name}_{pk_attr.name}")
                     column = MLDColumn(
                         name=col_name,
                         data_type=pk_attr.get_sql_type(),
                         is_primary_key=True,
                         is_foreign_key=True,
-                        references_table=self._safe_name(entity.name),
-                        references_column=self._safe_name(pk_attr.name),
+                        references_table=entity_name,
+                        references_column=_safe_name(pk_attr.name),
                         is_nullable=False
                     )
                     table.columns.append(column)
@@ -92,7 +139,7 @@ class MLDTransformer:
         # Add carrying attributes
         for attr in assoc.attributes:
             column = MLDColumn(
-                name=self._safe_name(attr.name),
+                name=_safe_name(attr.name),
                 data_type=attr.get_sql_type(),
                 is_primary_key=False,
                 is_nullable=True
@@ -101,42 +148,48 @@ class MLDTransformer:
 
         return table
 
-    def _add_foreign_keys(self, tables: List[MLDTable]):
+    def _add_foreign_keys(
+        self, tables: List[MLDTable], entities: List[Entity],
+        pk_cache: Dict[str, List[Attribute]], safe_entity_names: Dict[str, str]
+    ) -> None:
         """Add foreign key columns for 1-N relationships."""
         # Build a lookup for entity tables by source_id
         entity_tables = {t.source_id: t for t in tables if t.source_type == "entity"}
-
-        for entity in self._project.get_all_entities():
-            links = self._project.get_links_for_entity(entity.id)
-
-            for link in links:
-                if link.cardinality_max == "1":  # This entity is on the "1" side
-                    # Get other links in the same association
-                    assoc_links = self._project.get_links_for_association(link.association_id)
-
-                    for other_link in assoc_links:
-                        if other_link.entity_id != entity.id and other_link.cardinality_max == "N":
-                            # N-1 relationship: add FK to this entity's table
-                            other_entity = self._project.get_entity(other_link.entity_id)
-                            if other_entity and entity.id in entity_tables:
-                                table = entity_tables[entity.id]
-                                for pk_attr in other_entity.get_primary_keys():
-                                    col_name = f"fk_{self._safe_name(other_entity.name)}_{pk_attr.name}"
-                                    # Check if column already exists
-                                    if not any(c.name == col_name for c in table.columns):
-                                        column = MLDColumn(
-                                            name=col_name,
-                                            data_type=pk_attr.get_sql_type(),
-                                            is_primary_key=False,
-                                            is_foreign_key=True,
-                                            references_table=self._safe_name(other_entity.name),
-                                            references_column=self._safe_name(pk_attr.name),
-                                            is_nullable=link.cardinality_min == "0"
-                                        )
-                                        table.columns.append(column)
-
-    def _safe_name(self, name: str) -> str:
-        """Convert name to safe SQL identifier."""
-        safe = name.lower().replace(" ", "_").replace("-", "_")
-        safe = "".join(c for c in safe if c.isalnum() or c == "_")
-        return safe
+        # Column names per entity table, for O(1) duplicate checks
+        col_names = {source_id: {c.name for c in t.columns} for source_id, t in entity_tables.items()}
+
+        # "N"-side links of each association, grouped once up front
+        many_links: Dict[str, List[Link]] = {}
+        for link in self._project.iter_links():
+            if link.cardinality_max == "N":
+                many_links.setdefault(link.association_id, []).append(link)
+
+        for entity in entities:
+            if entity.id not in entity_tables:
+                continue
+            table = entity_tables[entity.id]
+
+            for link in self._project.get_links_for_entity(entity.id):
+                if link.cardinality_max != "1":  # This entity must be on the "1" side
+                    continue
+
+                for other_link in many_links.get(link.association_id, ()):
+                    # N-1 relationship: add FK to this entity's table
+                    if other_link.entity_id == entity.id or other_link.entity_id not in pk_cache:
+                        continue
+                    other_name = safe_entity_names[other_link.entity_id]
+                    for pk_attr in pk_cache[other_link.entity_id]:
+                        col_name = sys.intern(f"fk_{other_name}_{pk_attr.name}")
+                        # Check if column already exists
+                        if col_name not in col_names[entity.id]:
+                            column = MLDColumn(
+                                name=col_name,
+                                data_type=pk_attr.get_sql_type(),
+                                is_primary_key=False,
+                                is_foreign_key=True,
+                                references_table=other_name,
+                                references_column=_safe_name(pk_attr.name),
+                                is_nullable=link.cardinality_min == "0"
+                            )
+                            table.columns.append(column)
+                            col_names[entity.id].add(col_name)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List
 from ..models.project import Project
 from ..models.entity import Entity
 from ..models.association import Association
@@ -14,26 +14,23 @@ class SQLGenerator:
 
     def generate(self) -> str:
         """Generate complete SQL DDL script."""
-        lines = []
-        lines.append("-- Generated by Merisio")
-        lines.append("-- PostgreSQL DDL")
-        lines.append("")
+        return "".join(self.generate_iter())
+
+    def generate_iter(self) -> Iterator[str]:
+        """Generate the SQL DDL script piece by piece (one chunk per statement)."""
+        yield "-- Generated by Merisio\n-- PostgreSQL DDL\n"
 
         # Generate tables for entities
-        for entity in self._project.get_all_entities():
+        for entity in self._project.iter_entities():
             table_sql = self._generate_entity_table(entity)
             if table_sql:
-                lines.append(table_sql)
-                lines.append("")
+                yield f"\n{table_sql}\n"
 
         # Analyze associations and generate appropriate structures
-        for assoc in self._project.get_all_associations():
+        for assoc in self._project.iter_associations():
             assoc_sql = self._generate_association_table(assoc)
             if assoc_sql:
-                lines.append(assoc_sql)
-                lines.append("")
-
-        return "\n".join(lines)
+                yield f"\n{assoc_sql}\n"
 
     def _generate_entity_table(self, entity: Entity) -> str:
         """Generate CREATE TABLE statement for an entity."""
@@ -45,7 +42,7 @@ class SQLGenerator:
         pk_columns = []
 
         # Add columns from entity's own attributes
-        for attr in entity.attributes:
+        for attr in entity.iter_attributes():
             col_name = self._get_column_name(entity.name, attr.name)
             col_def = f"    {col_name} {attr.get_sql_type()}"
             if attr.is_primary_key:
@@ -1,4 +1,4 @@
-from PySide6.QtWidgets import QGraphicsScene
+from PySide6.QtWidgets import QGraphicsScene, QGraphicsItem
 from PySide6.QtCore import QRectF, QMarginsF
 from PySide6.QtGui import QPainter, QImage, QColor, QPageSize
 from PySide6.QtCore import QSizeF
@@ -31,17 +31,19 @@ class HeadlessRenderer:
         entity_items = {}
         association_items = {}
 
-        for entity in self._project.get_all_entities():
+        for entity in self._project.iter_entities():
             item = EntityItem(entity)
+            item.setCacheMode(QGraphicsItem.NoCache)  # Rendered once, to vector output too
             scene.addItem(item)
             entity_items[entity.id] = item
 
-        for assoc in self._project.get_all_associations():
+        for assoc in self._project.iter_associations():
             item = AssociationItem(assoc)
+            item.setCacheMode(QGraphicsItem.NoCache)
             scene.addItem(item)
             association_items[assoc.id] = item
 
-        for link in self._project.get_all_links():
+        for link in self._project.iter_links():
             entity_item = entity_items.get(link.entity_id)
             assoc_item = association_items.get(link.association_id)
             if entity_item and assoc_item:
@@ -1,12 +1,12 @@
 from dataclasses import dataclass, field
 from typing import List, TYPE_CHECKING
-import uuid
+import os
 
 if TYPE_CHECKING:
     from .attribute import Attribute
 
 
-@dataclass
+@dataclass(slots=True)
 class Association:
     """Represents an MCD association (relationship) with optional carrying attributes."""
 
@@ -14,7 +14,7 @@ class Association:
     attributes: List["Attribute"] = field(default_factory=list)  # Carrying attributes
     x: float = 0.0
     y: float = 0.0
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: os.urandom(16).hex())
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -51,7 +51,10 @@ class Association:
 
     def remove_attribute(self, attr_name: str) -> None:
         """Remove a carrying attribute by name."""
-        self.attributes = [a for a in self.attributes if a.name != attr_name]
+        for i, attr in enumerate(self.attributes):
+            if attr.name == attr_name:
+                del self.attributes[i]
+                break
 
     def has_attributes(self) -> bool:
         """Check if this association has carrying attributes."""
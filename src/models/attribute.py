@@ -1,8 +1,11 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 
+# Types whose SQL declaration carries a size, e.g. VARCHAR(100)
+_PARAM_TYPES = frozenset(("VARCHAR", "CHAR", "DECIMAL"))
 
-@dataclass
+
+@dataclass(slots=True)
 class Attribute:
     """Represents a data dictionary attribute."""
 
@@ -32,9 +35,10 @@ class Attribute:
 
     def get_sql_type(self) -> str:
         """Get the SQL type declaration."""
-        if self.size is not None and self.data_type in ("VARCHAR", "CHAR", "DECIMAL"):
-            return f"{self.data_type}({self.size})"
-        return self.data_type
+        data_type = self.data_type
+        if self.size is None or data_type not in _PARAM_TYPES:
+            return data_type
+        return f"{data_type}({self.size})"
 
     def __str__(self) -> str:
         pk_marker = " [PK]" if self.is_primary_key else ""
@@ -5,6 +5,8 @@ from .attribute import Attribute
 class Dictionary:
     """Data dictionary managing all attributes."""
 
+    __slots__ = ("_attributes",)
+
     def __init__(self):
         self._attributes: Dict[str, Attribute] = {}
 
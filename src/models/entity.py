@@ -1,27 +1,100 @@
 from dataclasses import dataclass, field
-from typing import List, TYPE_CHECKING
-import uuid
+from typing import Dict, Iterable, List, Optional, Sequence, ValuesView, TYPE_CHECKING
+import os
+import warnings
 
 if TYPE_CHECKING:
     from .attribute import Attribute
 
 
-@dataclass
+@dataclass(slots=True, init=False, eq=False)
 class Entity:
-    """Represents an MCD entity with its own attributes."""
+    """Represents an MCD entity with its own attributes.
+
+    Attribute names are unique within an entity: whichever way attributes are
+    added, the first one with a given name is kept and later duplicates are
+    dropped with a warning (older files could contain such duplicates).
+    """
 
     name: str
-    attributes: List["Attribute"] = field(default_factory=list)
-    x: float = 0.0
-    y: float = 0.0
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    _attributes: Dict[str, "Attribute"] = field(repr=False)  # Keyed by name, in declaration order
+    x: float
+    y: float
+    id: str
+
+    def __init__(
+        self,
+        name: str,
+        attributes: Optional[Iterable["Attribute"]] = None,
+        x: float = 0.0,
+        y: float = 0.0,
+        id: Optional[str] = None
+    ):
+        self.name = name
+        self._set_attributes(attributes or ())
+        self.x = x
+        self.y = y
+        self.id = id if id is not None else os.urandom(16).hex()
+
+    def __repr__(self) -> str:
+        return (
+            f"Entity(name={self.name!r}, attributes={self.attributes!r}, "
+            f"x={self.x!r}, y={self.y!r}, id={self.id!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        # Attribute order is significant (it drives the dialog and the DDL),
+        # so compare the values in order rather than the name-keyed dicts
+        if not isinstance(other, Entity):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.x == other.x
+            and self.y == other.y
+            and self.id == other.id
+            and list(self._attributes.values()) == list(other._attributes.values())
+        )
+
+    @property
+    def attributes(self) -> Sequence["Attribute"]:
+        """Get the attributes in declaration order, as a tuple (use add/remove_attribute).
+
+        Builds a new tuple on each call; loops should use iter_attributes().
+        """
+        return tuple(self._attributes.values())
+
+    @attributes.setter
+    def attributes(self, attributes: Sequence["Attribute"]) -> None:
+        """Replace all attributes (e.g. after the entity dialog reorders them)."""
+        self._set_attributes(attributes)
+
+    def iter_attributes(self) -> ValuesView["Attribute"]:
+        """Iterate over the attributes in declaration order, without copying."""
+        return self._attributes.values()
+
+    def _set_attributes(self, attributes: Iterable["Attribute"]) -> None:
+        """Index attributes by name, dropping duplicate names."""
+        self._attributes = {}
+        for attr in attributes:
+            self._insert_attribute(attr)
+
+    def _insert_attribute(self, attr: "Attribute") -> bool:
+        """Add attr unless its name is taken; return True if it was added."""
+        if attr.name in self._attributes:
+            warnings.warn(
+                f"Duplicate attribute '{attr.name}' in entity '{self.name}' ignored",
+                stacklevel=3
+            )
+            return False
+        self._attributes[attr.name] = attr
+        return True
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
             "id": self.id,
             "name": self.name,
-            "attributes": [attr.to_dict() for attr in self.attributes],
+            "attributes": [attr.to_dict() for attr in self._attributes.values()],
             "x": self.x,
             "y": self.y
         }
@@ -47,28 +120,37 @@ class Entity:
             y=data.get("y", 0.0)
         )
 
-    def add_attribute(self, attr: "Attribute") -> None:
-        """Add an attribute to this entity."""
-        self.attributes.append(attr)
+    def add_attribute(self, attr: "Attribute") -> bool:
+        """Add an attribute to this entity. Returns False if the name is taken."""
+        return self._insert_attribute(attr)
+
+    def extend_attributes(self, attrs: Iterable["Attribute"]) -> int:
+        """Add several attributes in one pass. Returns how many were added."""
+        added = 0
+        for attr in attrs:
+            if self._insert_attribute(attr):
+                added += 1
+        return added
 
     def remove_attribute(self, attr_name: str) -> None:
         """Remove an attribute by name."""
-        self.attributes = [a for a in self.attributes if a.name != attr_name]
+        self._attributes.pop(attr_name, None)
 
     def get_attribute(self, name: str) -> "Attribute | None":
         """Get an attribute by name."""
-        for attr in self.attributes:
-            if attr.name == name:
-                return attr
-        return None
+        return self._attributes.get(name)
+
+    def attribute_count(self) -> int:
+        """Get the number of attributes."""
+        return len(self._attributes)
 
     def get_primary_keys(self) -> List["Attribute"]:
         """Get list of primary key attributes."""
-        return [attr for attr in self.attributes if attr.is_primary_key]
+        return [attr for attr in self._attributes.values() if attr.is_primary_key]
 
     def get_primary_key_names(self) -> List[str]:
         """Get list of primary key attribute names."""
-        return [attr.name for attr in self.attributes if attr.is_primary_key]
+        return [attr.name for attr in self._attributes.values() if attr.is_primary_key]
 
     def __str__(self) -> str:
         return f"Entity({self.name})"
@@ -1,8 +1,8 @@
 from dataclasses import dataclass, field
-import uuid
+import os
 
 
-@dataclass
+@dataclass(slots=True)
 class Link:
     """Represents a link between an entity and an association with cardinality."""
 
@@ -10,7 +10,7 @@ class Link:
     association_id: str
     cardinality_min: str = "0"  # "0" or "1"
     cardinality_max: str = "N"  # "1" or "N"
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: os.urandom(16).hex())
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class MLDColumn:
     """Represents a column in a logical table."""
     name: str
@@ -14,7 +14,7 @@ class MLDColumn:
     is_nullable: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class MLDTable:
     """Represents a table in the logical data model."""
     name: str
@@ -1,16 +1,29 @@
-from typing import Dict, List, Optional, Tuple
+import json
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, ValuesView
 from datetime import datetime
 from .entity import Entity
 from .association import Association
 from .link import Link
 from .attribute import Attribute
 
+try:
+    import orjson  # Optional, faster project loading
+except ImportError:
+    orjson = None
+
 
 class Project:
     """Container for an entire AnalyseSI project."""
 
     VERSION = "2.1"  # Version with metadata support
 
+    __slots__ = (
+        "_entities", "_associations", "_links", "file_path", "modified",
+        "_links_by_entity", "_links_by_association", "_entity_by_name", "_attributes_cache",
+        "name", "description", "author", "created_at", "modified_at",
+        "_mld_column_overrides", "colors", "mcd_version", "_mld_cache", "_sql_cache",
+    )
+
     def __init__(self):
         self._entities: Dict[str, Entity] = {}
         self._associations: Dict[str, Association] = {}
@@ -18,6 +31,20 @@ class Project:
         self.file_path: Optional[str] = None
         self.modified = False
 
+        # Secondary indexes kept in sync with the dicts above
+        # (buckets are keyed by link id: ordered like _links, O(1) removal)
+        self._links_by_entity: Dict[str, Dict[str, Link]] = {}
+        self._links_by_association: Dict[str, Dict[str, Link]] = {}
+        # name -> {entity id: entity} in insertion order; the first one wins lookups
+        self._entity_by_name: Dict[str, Dict[str, Entity]] = {}
+        self._attributes_cache: Optional[List[Tuple[str, Attribute]]] = None
+
+        # Bumped on every MCD change; derived MLD/SQL output is cached
+        # against it as (mcd_version, result)
+        self.mcd_version = 0
+        self._mld_cache: Optional[tuple] = None
+        self._sql_cache: Optional[tuple] = None
+
         # Project metadata
         self.name: str = "Untitled Project"
         self.description: str = ""
@@ -25,8 +52,9 @@ class Project:
         self.created_at: str = datetime.now().isoformat()
         self.modified_at: str = self.created_at
 
-        # MLD customizations: {"TABLE.original_col": "new_col_name"}
-        self._mld_column_overrides: Dict[str, str] = {}
+        # MLD customizations: {"TABLE": {"original_col": "new_col_name"}},
+        # stored as "TABLE.original_col" keys in project files
+        self._mld_column_overrides: Dict[str, Dict[str, str]] = {}
 
         # Diagram colors (defaults)
         self.colors = {
@@ -41,21 +69,21 @@ class Project:
     def add_entity(self, entity: Entity) -> None:
         """Add an entity to the project."""
         self._entities[entity.id] = entity
-        self.modified = True
+        self._index_name(entity)
+        self._invalidate_attributes_cache()
+        self._bump_mcd_version()
 
     def remove_entity(self, entity_id: str) -> None:
         """Remove an entity and its associated links."""
         if entity_id in self._entities:
             # Remove all links connected to this entity
-            links_to_remove = [
-                link_id for link_id, link in self._links.items()
-                if link.entity_id == entity_id
-            ]
-            for link_id in links_to_remove:
-                del self._links[link_id]
+            for link in self._links_by_entity.pop(entity_id, {}).values():
+                del self._links[link.id]
+                self._discard_indexed(self._links_by_association, link.association_id, link)
 
-            del self._entities[entity_id]
-            self.modified = True
+            self._unindex_name(self._entities.pop(entity_id))
+            self._invalidate_attributes_cache()
+            self._bump_mcd_version()
 
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Get an entity by ID."""
@@ -63,34 +91,96 @@ class Project:
 
     def get_entity_by_name(self, name: str) -> Optional[Entity]:
         """Get an entity by name."""
-        for entity in self._entities.values():
+        entity = self._lookup_name(name)
+        if entity is None:
+            # The index may be stale if an entity was renamed in place
+            # rather than through rename_entity(): resync and retry
+            self._rebuild_name_index()
+            entity = self._lookup_name(name)
+        return entity
+
+    def _lookup_name(self, name: str) -> Optional[Entity]:
+        """Return the first indexed entity still named name, if any."""
+        for entity in self._entity_by_name.get(name, {}).values():
             if entity.name == name:
                 return entity
         return None
 
+    def rename_entity(self, entity_id: str, new_name: str) -> None:
+        """Rename an entity, keeping the name index in sync."""
+        entity = self._entities.get(entity_id)
+        if entity is None or entity.name == new_name:
+            return
+        self._unindex_name(entity)
+        entity.name = new_name
+        self._index_name(entity)
+        self._invalidate_attributes_cache()
+        self._bump_mcd_version()
+
+    def notify_entity_changed(self, entity_id: str) -> None:
+        """Signal that an entity's name or attributes were edited in place."""
+        if entity_id in self._entities:
+            self._invalidate_attributes_cache()
+            self._bump_mcd_version()
+
+    def notify_mcd_changed(self) -> None:
+        """Signal that an MCD element (e.g. an association or link) was edited in place."""
+        self._invalidate_attributes_cache()
+        self._bump_mcd_version()
+
+    def _bump_mcd_version(self) -> None:
+        """Record an MCD change, dropping the cached MLD/SQL output."""
+        self.mcd_version += 1
+        self._mld_cache = None
+        self._sql_cache = None
+        self.modified = True
+
+    def _index_name(self, entity: Entity) -> None:
+        """Add entity to the name index."""
+        self._entity_by_name.setdefault(entity.name, {})[entity.id] = entity
+
+    def _unindex_name(self, entity: Entity) -> None:
+        """Drop entity from the name index (a same-named entity, if any, takes over)."""
+        bucket = self._entity_by_name.get(entity.name)
+        if bucket is not None:
+            bucket.pop(entity.id, None)
+            if not bucket:
+                del self._entity_by_name[entity.name]
+
+    def _rebuild_name_index(self) -> None:
+        """Rebuild the name -> entities index from the current entity names."""
+        self._entity_by_name = {}
+        for entity in self._entities.values():
+            self._index_name(entity)
+
     def get_all_entities(self) -> List[Entity]:
         """Get all entities."""
         return list(self._entities.values())
 
+    def iter_entities(self) -> ValuesView[Entity]:
+        """Get a live view of all entities, without copying (do not mutate while iterating)."""
+        return self._entities.values()
+
+    def entity_count(self) -> int:
+        """Get the number of entities."""
+        return len(self._entities)
+
     # Association operations
     def add_association(self, association: Association) -> None:
         """Add an association to the project."""
         self._associations[association.id] = association
-        self.modified = True
+        self._bump_mcd_version()
 
     def remove_association(self, association_id: str) -> None:
         """Remove an association and its associated links."""
         if association_id in self._associations:
             # Remove all links connected to this association
-            links_to_remove = [
-                link_id for link_id, link in self._links.items()
-                if link.association_id == association_id
-            ]
-            for link_id in links_to_remove:
-                del self._links[link_id]
+            for link in self._links_by_association.pop(association_id, {}).values():
+                del self._links[link.id]
+                self._discard_indexed(self._links_by_entity, link.entity_id, link)
 
             del self._associations[association_id]
-            self.modified = True
+            self._bump_mcd_version()
 
     def get_association(self, association_id: str) -> Optional[Association]:
         """Get an association by ID."""
@@ -100,17 +190,45 @@ class Project:
         """Get all associations."""
         return list(self._associations.values())
 
+    def iter_associations(self) -> ValuesView[Association]:
+        """Get a live view of all associations, without copying (do not mutate while iterating)."""
+        return self._associations.values()
+
+    def association_count(self) -> int:
+        """Get the number of associations."""
+        return len(self._associations)
+
     # Link operations
     def add_link(self, link: Link) -> None:
         """Add a link to the project."""
+        if link.id in self._links:
+            self._unindex_link(self._links[link.id])
         self._links[link.id] = link
-        self.modified = True
+        self._index_link(link)
+        self._bump_mcd_version()
 
     def remove_link(self, link_id: str) -> None:
         """Remove a link."""
         if link_id in self._links:
-            del self._links[link_id]
-            self.modified = True
+            self._unindex_link(self._links.pop(link_id))
+            self._bump_mcd_version()
+
+    def _index_link(self, link: Link) -> None:
+        """Register a link in the entity/association indexes."""
+        self._links_by_entity.setdefault(link.entity_id, {})[link.id] = link
+        self._links_by_association.setdefault(link.association_id, {})[link.id] = link
+
+    def _unindex_link(self, link: Link) -> None:
+        """Drop a link from the entity/association indexes."""
+        self._discard_indexed(self._links_by_entity, link.entity_id, link)
+        self._discard_indexed(self._links_by_association, link.association_id, link)
+
+    @staticmethod
+    def _discard_indexed(index: Dict[str, Dict[str, Link]], key: str, link: Link) -> None:
+        """Remove a link from one index bucket, dropping the bucket once empty."""
+        links = index.get(key)
+        if links and links.pop(link.id, None) is not None and not links:
+            del index[key]
 
     def get_link(self, link_id: str) -> Optional[Link]:
         """Get a link by ID."""
@@ -120,56 +238,111 @@ class Project:
         """Get all links."""
         return list(self._links.values())
 
+    def iter_links(self) -> ValuesView[Link]:
+        """Get a live view of all links, without copying (do not mutate while iterating)."""
+        return self._links.values()
+
+    def link_count(self) -> int:
+        """Get the number of links."""
+        return len(self._links)
+
     def get_links_for_entity(self, entity_id: str) -> List[Link]:
         """Get all links connected to an entity."""
-        return [link for link in self._links.values() if link.entity_id == entity_id]
+        return list(self._links_by_entity.get(entity_id, {}).values())
 
     def get_links_for_association(self, association_id: str) -> List[Link]:
         """Get all links connected to an association."""
-        return [link for link in self._links.values() if link.association_id == association_id]
+        return list(self._links_by_association.get(association_id, {}).values())
 
     def get_entities_for_association(self, association_id: str) -> List[Entity]:
         """Get all entities linked to an association."""
-        links = self.get_links_for_association(association_id)
-        entities = []
-        for link in links:
-            entity = self.get_entity(link.entity_id)
-            if entity:
-                entities.append(entity)
-        return entities
+        get = self._entities.get
+        links = self._links_by_association.get(association_id, {}).values()
+        return [e for e in (get(link.entity_id) for link in links) if e is not None]
 
     # Attribute overview (for dictionary view)
-    def get_all_attributes(self) -> List[Tuple[str, Attribute]]:
-        """Get all attributes across all entities as (entity_name, attribute) tuples."""
-        result = []
+    def iter_attributes(self) -> Iterator[Tuple[str, Attribute]]:
+        """Iterate over all attributes across all entities as (entity_name, attribute) tuples."""
         for entity in self._entities.values():
-            for attr in entity.attributes:
-                result.append((entity.name, attr))
-        return result
+            for attr in entity.iter_attributes():
+                yield entity.name, attr
+
+    def get_all_attributes(self) -> List[Tuple[str, Attribute]]:
+        """Get all attributes across all entities as (entity_name, attribute) tuples.
+
+        The list is cached until an entity is added, removed, renamed or
+        reported changed through notify_entity_changed(); do not mutate it.
+        """
+        if self._attributes_cache is None:
+            self._attributes_cache = list(self.iter_attributes())
+        return self._attributes_cache
+
+    def _invalidate_attributes_cache(self) -> None:
+        """Drop the cached attribute overview."""
+        self._attributes_cache = None
+
+    def attribute_count(self) -> int:
+        """Get the number of attributes across all entities."""
+        if self._attributes_cache is not None:
+            return len(self._attributes_cache)
+        return sum(entity.attribute_count() for entity in self._entities.values())
+
+    # Derived output, cached per mcd_version
+    def get_cached_mld(self, builder: Callable[[], list]) -> list:
+        """Get the MLD tables, calling builder() only if the MCD changed since the last build."""
+        cache = self._mld_cache
+        if cache is None or cache[0] != self.mcd_version:
+            cache = self._mld_cache = (self.mcd_version, builder())
+        return cache[1]
+
+    def get_cached_sql(self, builder: Callable[[], str]) -> str:
+        """Get the SQL script, calling builder() only if the MCD or MLD overrides changed."""
+        cache = self._sql_cache
+        if cache is None or cache[0] != self.mcd_version:
+            cache = self._sql_cache = (self.mcd_version, builder())
+        return cache[1]
 
     # MLD column overrides
     def set_mld_column_name(self, table_name: str, original_name: str, new_name: str) -> None:
         """Set a custom column name for the MLD."""
-        key = f"{table_name}.{original_name}"
         if new_name and new_name != original_name:
-            self._mld_column_overrides[key] = new_name
-        elif key in self._mld_column_overrides:
-            del self._mld_column_overrides[key]
+            self._mld_column_overrides.setdefault(table_name, {})[original_name] = new_name
+        else:
+            overrides = self._mld_column_overrides.get(table_name)
+            if overrides and overrides.pop(original_name, None) is not None and not overrides:
+                del self._mld_column_overrides[table_name]
+        # Overrides only affect the generated SQL, not the MLD tables
+        self._sql_cache = None
         self.modified = True
 
     def get_mld_column_name(self, table_name: str, original_name: str) -> str:
         """Get the (possibly overridden) column name for the MLD."""
-        key = f"{table_name}.{original_name}"
-        return self._mld_column_overrides.get(key, original_name)
+        overrides = self._mld_column_overrides.get(table_name)
+        if overrides is None:
+            return original_name
+        return overrides.get(original_name, original_name)
 
-    def get_all_mld_overrides(self) -> Dict[str, str]:
-        """Get all MLD column overrides."""
-        return self._mld_column_overrides.copy()
+    def get_mld_column_overrides(self, table_name: str) -> Dict[str, str]:
+        """Get the column overrides of one MLD table, as {original_name: new_name}."""
+        return dict(self._mld_column_overrides.get(table_name, {}))
+
+    def get_all_mld_overrides(self) -> Dict[Tuple[str, str], str]:
+        """Get all MLD column overrides, keyed by (table_name, original_name)."""
+        return {
+            (table, column): name
+            for table, overrides in self._mld_column_overrides.items()
+            for column, name in overrides.items()
+        }
 
     # Serialization
-    def to_dict(self) -> dict:
-        """Convert project to dictionary for JSON serialization."""
-        self.modified_at = datetime.now().isoformat()
+    def to_dict(self, lazy: bool = False) -> dict:
+        """Convert project to dictionary for JSON serialization.
+
+        With lazy=True the MCD lists hold the model objects themselves, to be
+        converted one at a time by an encoder calling their to_dict().
+        """
+        if self.modified:  # Only stamp when there are unsaved changes
+            self.modified_at = datetime.now().isoformat()
         return {
             "version": self.VERSION,
             "metadata": {
@@ -180,16 +353,27 @@ class Project:
                 "modified_at": self.modified_at
             },
             "mcd": {
-                "entities": [e.to_dict() for e in self._entities.values()],
-                "associations": [a.to_dict() for a in self._associations.values()],
-                "links": [l.to_dict() for l in self._links.values()]
+                "entities": self._serialize_all(self._entities, lazy),
+                "associations": self._serialize_all(self._associations, lazy),
+                "links": self._serialize_all(self._links, lazy)
             },
             "mld": {
-                "column_overrides": self._mld_column_overrides
+                "column_overrides": {
+                    f"{table}.{column}": name
+                    for table, overrides in self._mld_column_overrides.items()
+                    for column, name in overrides.items()
+                }
             },
             "colors": self.colors
         }
 
+    @staticmethod
+    def _serialize_all(items: dict, lazy: bool) -> list:
+        """Serialize the values of one element dict, or just list them when lazy."""
+        if lazy:
+            return list(items.values())
+        return [item.to_dict() for item in items.values()]
+
     @classmethod
     def from_dict(cls, data: dict) -> "Project":
         """Create a Project from a dictionary."""
@@ -206,21 +390,25 @@ class Project:
         # Load MCD elements
         mcd = data.get("mcd", {})
 
-        for entity_data in mcd.get("entities", []):
-            entity = Entity.from_dict(entity_data)
-            project._entities[entity.id] = entity
-
-        for assoc_data in mcd.get("associations", []):
-            association = Association.from_dict(assoc_data)
-            project._associations[association.id] = association
+        project._entities = {
+            e.id: e for e in (Entity.from_dict(d) for d in mcd.get("entities", []))
+        }
+        project._associations = {
+            a.id: a for a in (Association.from_dict(d) for d in mcd.get("associations", []))
+        }
+        project._links = {
+            l.id: l for l in (Link.from_dict(d) for d in mcd.get("links", []))
+        }
 
-        for link_data in mcd.get("links", []):
-            link = Link.from_dict(link_data)
-            project._links[link.id] = link
+        project._rebuild_name_index()
+        for link in project._links.values():
+            project._index_link(link)
 
         # Load MLD customizations
         mld = data.get("mld", {})
-        project._mld_column_overrides = mld.get("column_overrides", {})
+        for key, name in mld.get("column_overrides", {}).items():
+            table, _, column = key.partition(".")
+            project._mld_column_overrides.setdefault(table, {})[column] = name
 
         # Load colors (merge with defaults to handle missing keys)
         saved_colors = data.get("colors", {})
@@ -229,11 +417,25 @@ class Project:
         project.modified = False
         return project
 
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> "Project":
+        """Create a Project from the raw contents of a project file."""
+        if orjson is not None:
+            return cls.from_dict(orjson.loads(data))
+        return cls.from_dict(json.loads(data))
+
     def clear(self) -> None:
         """Clear all project data."""
         self._entities.clear()
         self._associations.clear()
         self._links.clear()
+        self._links_by_entity.clear()
+        self._links_by_association.clear()
+        self._entity_by_name.clear()
+        self._attributes_cache = None
         self._mld_column_overrides.clear()
+        self.mcd_version += 1
+        self._mld_cache = None
+        self._sql_cache = None
         self.file_path = None
         self.modified = False
@@ -1,9 +1,81 @@
+import io
 import json
+import os
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Callable, Optional
 
 from ..models.project import Project
 
+try:
+    import orjson  # Optional, faster project saving
+except ImportError:
+    orjson = None
+
+
+def _model_to_dict(obj):
+    """Serialize a model object left in place by Project.to_dict(lazy=True)."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class _ProjectEncoder(json.JSONEncoder):
+    """JSON encoder converting entities, associations and links on the fly."""
+
+    def default(self, o):
+        return _model_to_dict(o)
+
+
+def _write_atomic(path: Path, write: Callable[[BinaryIO], None]) -> None:
+    """Call write() on a temp file in the same directory, then move it over
+    path, so an interrupted save never leaves a truncated project behind."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_path = path.parent / f".{path.name}.{os.urandom(4).hex()}.tmp"
+        try:
+            # 0o666 like open(): the kernel applies the process umask
+            fd = os.open(tmp_path, flags, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        # Keep the permissions of the file being replaced
+        try:
+            os.chmod(tmp_path, path.stat().st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_orjson(data: dict) -> Callable[[BinaryIO], None]:
+    """Writer serializing data with orjson (in one go: it has no streaming API)."""
+    def write(f: BinaryIO) -> None:
+        f.write(orjson.dumps(
+            data, default=_model_to_dict,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+        ))
+    return write
+
+
+def _write_json(data: dict) -> Callable[[BinaryIO], None]:
+    """Writer streaming data through the stdlib encoder, chunk by chunk."""
+    def write(f: BinaryIO) -> None:
+        text = io.TextIOWrapper(f, encoding='utf-8', newline='')
+        json.dump(data, text, indent=2, ensure_ascii=False, cls=_ProjectEncoder)
+        text.flush()
+        text.detach()  # Leave f open for _write_atomic
+    return write
+
 
 class FileIO:
     """Handles project file save/load operations."""
@@ -13,9 +85,10 @@ class FileIO:
         """Save a project to a JSON file."""
         try:
             path = Path(file_path)
-            data = project.to_dict()
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            data = project.to_dict(lazy=True)
+            # Written to a temp file first: a failure leaves the existing file intact
+            writer = _write_orjson if orjson is not None else _write_json
+            _write_atomic(path, writer(data))
             project.file_path = file_path
             project.modified = False
             return True
@@ -28,9 +101,8 @@ class FileIO:
         """Load a project from a JSON file."""
         try:
             path = Path(file_path)
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            project = Project.from_dict(data)
+            with open(path, 'rb') as f:
+                project = Project.from_json_bytes(f.read())
             project.file_path = file_path
             return project
         except Exception as e:
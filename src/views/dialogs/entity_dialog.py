@@ -238,9 +238,13 @@ class EntityDialog(QDialog):
 
         self.accept()
 
+    def get_name(self) -> str:
+        """Get the entity name entered in the dialog."""
+        return self._name_edit.text().strip()
+
     def get_entity(self) -> Entity | None:
         """Get the entity from the dialog."""
-        name = self._name_edit.text().strip()
+        name = self.get_name()
         if not name:
             return None
 
@@ -1,3 +1,6 @@
+from datetime import datetime
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout,
     QLineEdit, QTextEdit, QDialogButtonBox, QLabel
@@ -7,6 +10,16 @@ from PySide6.QtCore import Qt
 from ...models.project import Project
 
 
+@lru_cache(maxsize=128)
+def _format_timestamp(iso_timestamp: str) -> str:
+    """Format ISO timestamp to human-readable format."""
+    try:
+        dt = datetime.fromisoformat(iso_timestamp)
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, TypeError):
+        return iso_timestamp or "Unknown"
+
+
 class ProjectPropertiesDialog(QDialog):
     """Dialog for editing project properties/metadata."""
 
@@ -71,21 +84,12 @@ class ProjectPropertiesDialog(QDialog):
         self._description_edit.setPlainText(self._project.description)
 
         # Format timestamps
-        created = self._format_timestamp(self._project.created_at)
-        modified = self._format_timestamp(self._project.modified_at)
+        created = _format_timestamp(self._project.created_at)
+        modified = _format_timestamp(self._project.modified_at)
 
         self._created_label.setText(f"Created: {created}")
         self._modified_label.setText(f"Last modified: {modified}")
 
-    def _format_timestamp(self, iso_timestamp: str) -> str:
-        """Format ISO timestamp to human-readable format."""
-        try:
-            from datetime import datetime
-            dt = datetime.fromisoformat(iso_timestamp)
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except (ValueError, TypeError):
-            return iso_timestamp or "Unknown"
-
     def _on_accept(self):
         """Validate and accept the dialog."""
         name = self._name_edit.text().strip()
@@ -9,33 +9,94 @@ from ..models.attribute import Attribute
 from ..models.project import Project
 
 
+def _changed_span(old: list, new: list) -> tuple[int, int, int]:
+    """Find the block that differs between two row lists.
+
+    Returns (start, old_end, new_end): old[start:old_end] was replaced by
+    new[start:new_end], everything before and after is unchanged.
+    """
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and old[start] == new[start]:
+        start += 1
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    return start, old_end, new_end
+
+
 class DictionaryTableModel(QAbstractTableModel):
     """Read-only table model showing all attributes across entities."""
 
-    COLUMNS = ["Entity", "Attribute", "Type", "Size", "PK"]
+    COLUMNS = ("Entity", "Attribute", "Type", "Size", "PK")
+    _NCOLS = len(COLUMNS)
+    _PK_COLOR = QColor("#FFFDE7")  # Light yellow for PKs
+    # TextAlignmentRole value per column (Size and PK are centered)
+    _ALIGNMENTS = (None, None, None, Qt.AlignCenter, Qt.AlignCenter)
 
     def __init__(self, project: Project, parent=None):
         super().__init__(parent)
         self._project = project
-        self._data: list[tuple[str, Attribute]] = []
+        # One tuple per attribute: the five display strings, then the background
+        self._rows: list[tuple[str, str, str, str, str, QColor | None]] = []
         self.refresh()
 
     def set_project(self, project: Project):
-        """Set a new project and refresh."""
+        """Set a new project and reset the model."""
         self._project = project
-        self.refresh()
-
-    def refresh(self):
-        """Refresh the model from the project."""
         self.beginResetModel()
-        self._data = self._project.get_all_attributes()
+        self._rows = self._build_rows()
         self.endResetModel()
 
+    def refresh(self):
+        """Refresh the model from the project, signalling only the rows that changed."""
+        rows = self._build_rows()
+        if rows == self._rows:
+            return
+
+        start, old_end, new_end = _changed_span(self._rows, rows)
+        if old_end == new_end:
+            # Same number of rows: update the changed block in place
+            self._rows = rows
+            self.dataChanged.emit(
+                self.index(start, 0), self.index(old_end - 1, self._NCOLS - 1)
+            )
+        elif old_end == start:
+            self.beginInsertRows(QModelIndex(), start, new_end - 1)
+            self._rows = rows
+            self.endInsertRows()
+        elif new_end == start:
+            self.beginRemoveRows(QModelIndex(), start, old_end - 1)
+            self._rows = rows
+            self.endRemoveRows()
+        else:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+
+    def _build_rows(self) -> list[tuple[str, str, str, str, str, QColor | None]]:
+        """Format all project attributes for display."""
+        return [self._make_row(entity_name, attr)
+                for entity_name, attr in self._project.get_all_attributes()]
+
+    @classmethod
+    def _make_row(cls, entity_name: str, attr: Attribute) -> tuple[str, str, str, str, str, QColor | None]:
+        """Format one attribute for display."""
+        return (
+            entity_name,
+            attr.name,
+            attr.data_type,
+            str(attr.size) if attr.size else "",
+            "Yes" if attr.is_primary_key else "No",
+            cls._PK_COLOR if attr.is_primary_key else None,
+        )
+
     def rowCount(self, parent=QModelIndex()) -> int:
-        return len(self._data)
+        return len(self._rows)
 
     def columnCount(self, parent=QModelIndex()) -> int:
-        return len(self.COLUMNS)
+        return self._NCOLS
 
     def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.DisplayRole):
         if role == Qt.DisplayRole and orientation == Qt.Horizontal:
@@ -43,32 +104,16 @@ class DictionaryTableModel(QAbstractTableModel):
         return None
 
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
-        if not index.isValid() or index.row() >= len(self._data):
+        if not index.isValid() or index.row() >= len(self._rows):
             return None
 
-        entity_name, attr = self._data[index.row()]
-        col = index.column()
-
+        # Every role is a lookup into the precomputed row or a per-column table
         if role == Qt.DisplayRole:
-            if col == 0:
-                return entity_name
-            elif col == 1:
-                return attr.name
-            elif col == 2:
-                return attr.data_type
-            elif col == 3:
-                return str(attr.size) if attr.size else ""
-            elif col == 4:
-                return "Yes" if attr.is_primary_key else "No"
-
-        elif role == Qt.BackgroundRole:
-            if attr.is_primary_key:
-                return QColor("#FFFDE7")  # Light yellow for PKs
-
-        elif role == Qt.TextAlignmentRole:
-            if col in (3, 4):
-                return Qt.AlignCenter
-
+            return self._rows[index.row()][index.column()]
+        if role == Qt.BackgroundRole:
+            return self._rows[index.row()][5]
+        if role == Qt.TextAlignmentRole:
+            return self._ALIGNMENTS[index.column()]
         return None
 
 
@@ -1,5 +1,5 @@
 from PySide6.QtWidgets import (
-    QGraphicsView, QGraphicsScene, QMenu, QMessageBox
+    QGraphicsView, QGraphicsItem, QMenu, QMessageBox
 )
 from PySide6.QtCore import Qt, Signal, QPointF, QMarginsF, QRectF
 from PySide6.QtGui import QPainter, QAction, QImage, QColor
@@ -11,7 +11,7 @@ from ..models.project import Project
 from ..models.entity import Entity
 from ..models.association import Association
 from ..models.link import Link
-from .mcd_items import EntityItem, AssociationItem, LinkItem
+from .mcd_items import MCDScene, EntityItem, AssociationItem, LinkItem
 
 
 class MCDCanvas(QGraphicsView):
@@ -29,7 +29,7 @@ class MCDCanvas(QGraphicsView):
     def __init__(self, project: Project, parent=None):
         super().__init__(parent)
         self._project = project
-        self._scene = QGraphicsScene(self)
+        self._scene = MCDScene(self)
         self.setScene(self._scene)
 
         # Item tracking
@@ -71,31 +71,32 @@ class MCDCanvas(QGraphicsView):
 
     def refresh(self):
         """Refresh the canvas from the project data."""
-        self._scene.clear()
-        self._entity_items.clear()
-        self._association_items.clear()
-        self._link_items.clear()
-
-        # Create entity items
-        for entity in self._project.get_all_entities():
-            item = EntityItem(entity)
-            self._scene.addItem(item)
-            self._entity_items[entity.id] = item
+        with self._scene.batch_update():
+            self._scene.clear()
+            self._entity_items.clear()
+            self._association_items.clear()
+            self._link_items.clear()
+
+            # Create entity items
+            for entity in self._project.iter_entities():
+                item = EntityItem(entity)
+                self._scene.addItem(item)
+                self._entity_items[entity.id] = item
 
-        # Create association items
-        for assoc in self._project.get_all_associations():
-            item = AssociationItem(assoc)
-            self._scene.addItem(item)
-            self._association_items[assoc.id] = item
-
-        # Create link items
-        for link in self._project.get_all_links():
-            entity_item = self._entity_items.get(link.entity_id)
-            assoc_item = self._association_items.get(link.association_id)
-            if entity_item and assoc_item:
-                item = LinkItem(link, entity_item, assoc_item)
+            # Create association items
+            for assoc in self._project.iter_associations():
+                item = AssociationItem(assoc)
                 self._scene.addItem(item)
-                self._link_items[link.id] = item
+                self._association_items[assoc.id] = item
+
+            # Create link items
+            for link in self._project.iter_links():
+                entity_item = self._entity_items.get(link.entity_id)
+                assoc_item = self._association_items.get(link.association_id)
+                if entity_item and assoc_item:
+                    item = LinkItem(link, entity_item, assoc_item)
+                    self._scene.addItem(item)
+                    self._link_items[link.id] = item
 
     def _show_context_menu(self, pos):
         """Show context menu at the given position."""
@@ -195,7 +196,9 @@ class MCDCanvas(QGraphicsView):
 
         dialog = EntityDialog(entity=item.entity, parent=self)
         if dialog.exec():
-            dialog.get_entity()  # Updates the entity in place
+            self._project.rename_entity(item.entity.id, dialog.get_name())
+            dialog.get_entity()  # Updates the attributes in place
+            self._project.notify_entity_changed(item.entity.id)
             item.refresh()
             self.modified.emit()
 
@@ -231,6 +234,7 @@ class MCDCanvas(QGraphicsView):
         dialog = AssociationDialog(association=item.association, parent=self)
         if dialog.exec():
             dialog.get_association()  # Updates the association in place
+            self._project.notify_mcd_changed()
             item.refresh()
             self.modified.emit()
 
@@ -331,7 +335,10 @@ class MCDCanvas(QGraphicsView):
 
         dialog = LinkDialog(entities, associations, link=item.link, parent=self)
         if dialog.exec():
+            # Re-register so the project's link indexes follow endpoint changes
+            self._project.remove_link(item.link.id)
             dialog.get_link()  # Updates the link in place
+            self._project.add_link(item.link)
             item.update_position()
             self.modified.emit()
 
@@ -398,38 +405,39 @@ class MCDCanvas(QGraphicsView):
         if result != QMessageBox.Yes:
             return
 
-        for item in selected:
-            if isinstance(item, EntityItem):
-                # Remove connected links first
-                links_to_remove = self._project.get_links_for_entity(item.entity.id)
-                for link in links_to_remove:
-                    link_item = self._link_items.get(link.id)
-                    if link_item:
-                        link_item.cleanup()
-                        self._scene.removeItem(link_item)
-                        del self._link_items[link.id]
-                self._project.remove_entity(item.entity.id)
-                self._scene.removeItem(item)
-                del self._entity_items[item.entity.id]
-
-            elif isinstance(item, AssociationItem):
-                # Remove connected links first
-                links_to_remove = self._project.get_links_for_association(item.association.id)
-                for link in links_to_remove:
-                    link_item = self._link_items.get(link.id)
-                    if link_item:
-                        link_item.cleanup()
-                        self._scene.removeItem(link_item)
-                        del self._link_items[link.id]
-                self._project.remove_association(item.association.id)
-                self._scene.removeItem(item)
-                del self._association_items[item.association.id]
-
-            elif isinstance(item, LinkItem):
-                item.cleanup()
-                self._project.remove_link(item.link.id)
-                self._scene.removeItem(item)
-                del self._link_items[item.link.id]
+        with self._scene.batch_update():
+            for item in selected:
+                if isinstance(item, EntityItem):
+                    # Remove connected links first
+                    links_to_remove = self._project.get_links_for_entity(item.entity.id)
+                    for link in links_to_remove:
+                        link_item = self._link_items.get(link.id)
+                        if link_item:
+                            link_item.cleanup()
+                            self._scene.removeItem(link_item)
+                            del self._link_items[link.id]
+                    self._project.remove_entity(item.entity.id)
+                    self._scene.removeItem(item)
+                    del self._entity_items[item.entity.id]
+
+                elif isinstance(item, AssociationItem):
+                    # Remove connected links first
+                    links_to_remove = self._project.get_links_for_association(item.association.id)
+                    for link in links_to_remove:
+                        link_item = self._link_items.get(link.id)
+                        if link_item:
+                            link_item.cleanup()
+                            self._scene.removeItem(link_item)
+                            del self._link_items[link.id]
+                    self._project.remove_association(item.association.id)
+                    self._scene.removeItem(item)
+                    del self._association_items[item.association.id]
+
+                elif isinstance(item, LinkItem):
+                    item.cleanup()
+                    self._project.remove_link(item.link.id)
+                    self._scene.removeItem(item)
+                    del self._link_items[item.link.id]
 
         self.modified.emit()
 
@@ -571,6 +579,17 @@ class MCDCanvas(QGraphicsView):
         """Get current zoom level as percentage."""
         return int(self._zoom_level * 100)
 
+    def _render_uncached(self, painter: QPainter, target: QRectF, source: QRectF):
+        """Render the scene with item caching off, so exports stay vector/full resolution."""
+        items = list(self._entity_items.values()) + list(self._association_items.values())
+        for item in items:
+            item.setCacheMode(QGraphicsItem.NoCache)
+        try:
+            self._scene.render(painter, target, source)
+        finally:
+            for item in items:
+                item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
     def export_to_svg(self, file_path: str) -> bool:
         """Export the diagram to SVG format."""
         try:
@@ -591,7 +610,7 @@ class MCDCanvas(QGraphicsView):
             painter = QPainter()
             painter.begin(generator)
             painter.setRenderHint(QPainter.Antialiasing)
-            self._scene.render(painter, QRectF(0, 0, items_rect.width(), items_rect.height()), items_rect)
+            self._render_uncached(painter, QRectF(0, 0, items_rect.width(), items_rect.height()), items_rect)
             painter.end()
             return True
         except Exception:
@@ -618,7 +637,7 @@ class MCDCanvas(QGraphicsView):
             painter.begin(image)
             painter.setRenderHint(QPainter.Antialiasing)
             painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            self._scene.render(painter, QRectF(0, 0, width, height), items_rect)
+            self._render_uncached(painter, QRectF(0, 0, width, height), items_rect)
             painter.end()
 
             return image.save(file_path, "PNG")
@@ -655,7 +674,7 @@ class MCDCanvas(QGraphicsView):
             scale = min(writer.width() / items_rect.width(), writer.height() / items_rect.height())
             painter.scale(scale, scale)
 
-            self._scene.render(painter, QRectF(0, 0, items_rect.width(), items_rect.height()), items_rect)
+            self._render_uncached(painter, QRectF(0, 0, items_rect.width(), items_rect.height()), items_rect)
             painter.end()
             return True
         except Exception:
@@ -698,4 +717,4 @@ class MCDCanvas(QGraphicsView):
         for item in self._association_items.values():
             item.update()
         for item in self._link_items.values():
-            item.update()
+            item.refresh_style()
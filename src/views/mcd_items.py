@@ -1,13 +1,15 @@
 from PySide6.QtWidgets import (
-    QGraphicsItem, QGraphicsRectItem, QGraphicsEllipseItem,
+    QGraphicsItem, QGraphicsScene, QGraphicsRectItem, QGraphicsEllipseItem,
     QGraphicsLineItem, QGraphicsTextItem, QGraphicsPathItem,
     QStyleOptionGraphicsItem, QWidget
 )
-from PySide6.QtCore import Qt, QRectF, QPointF, QLineF
+from PySide6.QtCore import Qt, QRectF, QPointF, QLineF, QTimer
 from PySide6.QtGui import (
     QPainter, QPen, QBrush, QColor, QFont, QFontMetrics, QPainterPath
 )
 import math
+from contextlib import contextmanager
+from functools import lru_cache
 
 from ..models.entity import Entity
 from ..models.association import Association
@@ -19,6 +21,103 @@ from ..utils.constants import (
 )
 
 
+# Fixed drawing resources, built once
+_SELECTED_BRUSH = QBrush(QColor(SELECTED_COLOR).lighter(150))
+_SELECTED_PEN = QPen(QColor(SELECTED_COLOR), 2)
+_LABEL_BRUSH = QBrush(QColor("white"))
+_LABEL_TEXT_COLOR = QColor("black")
+
+# Below this level of detail (scale), items skip drawing their text
+_TEXT_MIN_LOD = 0.3
+
+
+# Pens, brushes and fonts are shared between paints. Colors can change at
+# runtime (apply_colors), so they are cached per value rather than per class.
+@lru_cache(maxsize=None)
+def _pen(color: str, width: int) -> QPen:
+    return QPen(QColor(color), width)
+
+
+@lru_cache(maxsize=None)
+def _brush(color: str) -> QBrush:
+    return QBrush(QColor(color))
+
+
+@lru_cache(maxsize=None)
+def _font(bold: bool = False, italic: bool = False, underline: bool = False,
+          size_delta: int = 0) -> QFont:
+    font = QFont()
+    font.setBold(bold)
+    font.setItalic(italic)
+    font.setUnderline(underline)
+    if size_delta:
+        font.setPointSize(font.pointSize() + size_delta)
+    return font
+
+
+class MCDScene(QGraphicsScene):
+    """Scene that coalesces link geometry updates while items are dragged."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending_links: set["LinkItem"] = set()
+        self._link_timer = QTimer(self)
+        self._link_timer.setSingleShot(True)
+        self._link_timer.setInterval(0)
+        self._link_timer.timeout.connect(self._flush_link_updates)
+        self._batch_depth = 0
+
+    @contextmanager
+    def batch_update(self):
+        """Suspend scene signals and view repaints for a bulk change.
+
+        Link updates queued meanwhile are applied once on exit, followed by
+        a single repaint. Batches may be nested.
+        """
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self.blockSignals(True)
+            for view in self.views():
+                view.setUpdatesEnabled(False)
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._link_timer.stop()
+                self._flush_link_updates()
+                self.blockSignals(False)
+                for view in self.views():
+                    view.setUpdatesEnabled(True)
+                self.update()
+
+    def schedule_link_updates(self, link_items):
+        """Queue links for a single update_position() on the next event-loop pass."""
+        self._pending_links.update(link_items)
+        if not self._batch_depth:  # Flushed when the batch ends
+            self._link_timer.start()
+
+    def _flush_link_updates(self):
+        pending, self._pending_links = self._pending_links, set()
+        for link_item in pending:
+            if link_item.scene() is self:  # Skip links removed in the meantime
+                link_item.update_position()
+
+    def clear(self):
+        self._pending_links.clear()
+        super().clear()
+
+
+def _update_links(scene, link_items):
+    """Reposition links after an item moved: batched once per event-loop pass
+    on an MCDScene, immediately on any other scene (or none)."""
+    if isinstance(scene, MCDScene):
+        scene.schedule_link_updates(link_items)
+    else:
+        for link_item in link_items:
+            link_item.update_position()
+
+
 class EntityItem(QGraphicsItem):
     """Graphical representation of an MCD entity."""
 
@@ -39,31 +138,35 @@ class EntityItem(QGraphicsItem):
         self.setFlag(QGraphicsItem.ItemIsMovable)
         self.setFlag(QGraphicsItem.ItemIsSelectable)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges)
+        # Blit a cached rendering until update() is called (selection, refresh, colors)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.setCursor(Qt.OpenHandCursor)
-        self._links: list["LinkItem"] = []
+        self._links: set["LinkItem"] = set()
         self._update_size()
 
     def _update_size(self):
         """Update size based on content."""
         self.prepareGeometryChange()
         # Measure entity name with bold font (as drawn)
-        bold_font = QFont()
-        bold_font.setBold(True)
-        fm_bold = QFontMetrics(bold_font)
+        fm_bold = QFontMetrics(_font(bold=True))
         name_width = fm_bold.horizontalAdvance(self.entity.name) + 20
 
-        if EntityItem.show_attributes and self.entity.attributes:
+        if EntityItem.show_attributes and self.entity.attribute_count():
             self._width = max(self.MIN_WIDTH, name_width, self._calculate_width())
-            self._height = self.HEADER_HEIGHT + len(self.entity.attributes) * self.ATTR_HEIGHT + 10
+            self._height = self.HEADER_HEIGHT + self.entity.attribute_count() * self.ATTR_HEIGHT + 10
         else:
             self._width = max(self.MIN_WIDTH, name_width)
             self._height = ENTITY_HEIGHT
 
+        # Outline is only rebuilt when the geometry changes
+        self._path = QPainterPath()
+        self._path.addRoundedRect(self.boundingRect(), 3, 3)  # Sharp corners (minimal rounding)
+
     def _calculate_width(self):
         """Calculate width based on longest attribute text."""
-        fm = QFontMetrics(QFont())
+        fm = QFontMetrics(_font())
         max_width = 0
-        for attr in self.entity.attributes:
+        for attr in self.entity.iter_attributes():
             attr_text = f"{attr.name} : {attr.data_type}"
             if attr.size:
                 attr_text += f"({attr.size})"
@@ -75,42 +178,42 @@ class EntityItem(QGraphicsItem):
 
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget = None):
         rect = self.boundingRect()
-        path = QPainterPath()
-        path.addRoundedRect(rect, 3, 3)  # Sharp corners (minimal rounding)
 
         # Fill
         if self.isSelected():
-            painter.setBrush(QBrush(QColor(SELECTED_COLOR).lighter(150)))
-            painter.setPen(QPen(QColor(SELECTED_COLOR), 2))
+            painter.setBrush(_SELECTED_BRUSH)
+            painter.setPen(_SELECTED_PEN)
         else:
-            painter.setBrush(QBrush(QColor(EntityItem.fill_color)))
-            painter.setPen(QPen(QColor(EntityItem.border_color), 2))
+            painter.setBrush(_brush(EntityItem.fill_color))
+            painter.setPen(_pen(EntityItem.border_color, 2))
 
-        painter.drawPath(path)
+        painter.drawPath(self._path)
+
+        # Text is unreadable when zoomed far out: the outline alone is enough
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < _TEXT_MIN_LOD:
+            return
 
         # Draw entity name (header)
         painter.setPen(Qt.black)
-        font = QFont()
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setFont(_font(bold=True))
 
-        if EntityItem.show_attributes and self.entity.attributes:
+        if EntityItem.show_attributes and self.entity.attribute_count():
             # Draw header with name
             header_rect = QRectF(rect.left(), rect.top(), rect.width(), self.HEADER_HEIGHT)
             painter.drawText(header_rect, Qt.AlignCenter, self.entity.name)
 
             # Draw separator line
             sep_y = rect.top() + self.HEADER_HEIGHT
-            painter.setPen(QPen(QColor(EntityItem.border_color), 1))
+            painter.setPen(_pen(EntityItem.border_color, 1))
             painter.drawLine(int(rect.left() + 5), int(sep_y), int(rect.right() - 5), int(sep_y))
 
             # Draw attributes
-            font.setBold(False)
+            font = _font()
             painter.setFont(font)
             painter.setPen(Qt.black)
 
             y = rect.top() + self.HEADER_HEIGHT + 5
-            for attr in self.entity.attributes:
+            for attr in self.entity.iter_attributes():
                 attr_text = f"{attr.name} : {attr.data_type}"
                 if attr.size:
                     attr_text += f"({attr.size})"
@@ -119,10 +222,8 @@ class EntityItem(QGraphicsItem):
 
                 if attr.is_primary_key:
                     # Underline for primary key
-                    font.setUnderline(True)
-                    painter.setFont(font)
+                    painter.setFont(_font(underline=True))
                     painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, attr_text)
-                    font.setUnderline(False)
                     painter.setFont(font)
                 else:
                     painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, attr_text)
@@ -139,19 +240,16 @@ class EntityItem(QGraphicsItem):
             self.entity.x = pos.x()
             self.entity.y = pos.y()
             # Update connected links
-            for link_item in self._links:
-                link_item.update_position()
+            _update_links(self.scene(), self._links)
         return super().itemChange(change, value)
 
     def add_link(self, link_item: "LinkItem"):
         """Register a link item connected to this entity."""
-        if link_item not in self._links:
-            self._links.append(link_item)
+        self._links.add(link_item)
 
     def remove_link(self, link_item: "LinkItem"):
         """Unregister a link item."""
-        if link_item in self._links:
-            self._links.remove(link_item)
+        self._links.discard(link_item)
 
     def get_center(self) -> QPointF:
         """Get the center point in scene coordinates."""
@@ -214,23 +312,23 @@ class AssociationItem(QGraphicsItem):
         self.setFlag(QGraphicsItem.ItemIsMovable)
         self.setFlag(QGraphicsItem.ItemIsSelectable)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges)
+        # Blit a cached rendering until update() is called (selection, refresh, colors)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.setCursor(Qt.OpenHandCursor)
-        self._links: list["LinkItem"] = []
+        self._links: set["LinkItem"] = set()
         self._update_size()
 
     def _update_size(self):
         """Update size based on content."""
         self.prepareGeometryChange()
         # Measure association name with italic font (as drawn)
-        italic_font = QFont()
-        italic_font.setItalic(True)
-        fm_italic = QFontMetrics(italic_font)
+        fm_italic = QFontMetrics(_font(italic=True))
         name_width = fm_italic.horizontalAdvance(self.association.name) + 30
         self._width = max(self.MIN_WIDTH, name_width)
 
         if AssociationItem.show_attributes and self.association.attributes:
             # Calculate width for attributes too
-            fm = QFontMetrics(QFont())
+            fm = QFontMetrics(_font())
             for attr in self.association.attributes:
                 attr_text = f"{attr.name} : {attr.data_type}"
                 if attr.size:
@@ -241,32 +339,35 @@ class AssociationItem(QGraphicsItem):
         else:
             self._height = self.MIN_HEIGHT
 
+        # Fully rounded corners (pill shape) - radius is half the height;
+        # the outline is only rebuilt when the geometry changes
+        radius = self._height / 2 if not (AssociationItem.show_attributes and self.association.attributes) else 15
+        self._path = QPainterPath()
+        self._path.addRoundedRect(self.boundingRect(), radius, radius)
+
     def boundingRect(self) -> QRectF:
         return QRectF(-self._width / 2, -self._height / 2, self._width, self._height)
 
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget = None):
         rect = self.boundingRect()
-        path = QPainterPath()
-
-        # Fully rounded corners (pill shape) - radius is half the height
-        radius = self._height / 2 if not (AssociationItem.show_attributes and self.association.attributes) else 15
-        path.addRoundedRect(rect, radius, radius)
 
         # Fill
         if self.isSelected():
-            painter.setBrush(QBrush(QColor(SELECTED_COLOR).lighter(150)))
-            painter.setPen(QPen(QColor(SELECTED_COLOR), 2))
+            painter.setBrush(_SELECTED_BRUSH)
+            painter.setPen(_SELECTED_PEN)
         else:
-            painter.setBrush(QBrush(QColor(AssociationItem.fill_color)))
-            painter.setPen(QPen(QColor(AssociationItem.border_color), 2))
+            painter.setBrush(_brush(AssociationItem.fill_color))
+            painter.setPen(_pen(AssociationItem.border_color, 2))
 
-        painter.drawPath(path)
+        painter.drawPath(self._path)
+
+        # Text is unreadable when zoomed far out: the outline alone is enough
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < _TEXT_MIN_LOD:
+            return
 
         # Draw association name
         painter.setPen(Qt.black)
-        font = QFont()
-        font.setItalic(True)
-        painter.setFont(font)
+        painter.setFont(_font(italic=True))
 
         if AssociationItem.show_attributes and self.association.attributes:
             # Draw header with name
@@ -275,13 +376,11 @@ class AssociationItem(QGraphicsItem):
 
             # Draw separator line
             sep_y = rect.top() + self.HEADER_HEIGHT - 3
-            painter.setPen(QPen(QColor(AssociationItem.border_color), 1))
+            painter.setPen(_pen(AssociationItem.border_color, 1))
             painter.drawLine(int(rect.left() + 10), int(sep_y), int(rect.right() - 10), int(sep_y))
 
             # Draw carrying attributes
-            font.setItalic(False)
-            font.setPointSize(font.pointSize() - 1)
-            painter.setFont(font)
+            painter.setFont(_font(size_delta=-1))
             painter.setPen(Qt.black)
 
             y = rect.top() + self.HEADER_HEIGHT
@@ -303,19 +402,16 @@ class AssociationItem(QGraphicsItem):
             self.association.x = pos.x()
             self.association.y = pos.y()
             # Update connected links
-            for link_item in self._links:
-                link_item.update_position()
+            _update_links(self.scene(), self._links)
         return super().itemChange(change, value)
 
     def add_link(self, link_item: "LinkItem"):
         """Register a link item connected to this association."""
-        if link_item not in self._links:
-            self._links.append(link_item)
+        self._links.add(link_item)
 
     def remove_link(self, link_item: "LinkItem"):
         """Unregister a link item."""
-        if link_item in self._links:
-            self._links.remove(link_item)
+        self._links.discard(link_item)
 
     def get_center(self) -> QPointF:
         """Get the center point in scene coordinates."""
@@ -379,13 +475,13 @@ class LinkItem(QGraphicsPathItem):
         self.association_item = association_item
 
         self.setFlag(QGraphicsItem.ItemIsSelectable)
-        self.setPen(QPen(QColor(LinkItem.line_color), 1))
+        self.setPen(_pen(LinkItem.line_color, 1))
         self.setBrush(Qt.NoBrush)
 
         # Create background for cardinality label (white box)
         self._card_bg = QGraphicsRectItem(self)
-        self._card_bg.setBrush(QBrush(QColor("white")))
-        self._card_bg.setPen(QPen(QColor(LinkItem.line_color), 1))
+        self._card_bg.setBrush(_LABEL_BRUSH)
+        self._card_bg.setPen(_pen(LinkItem.line_color, 1))
 
         # Create cardinality label
         self._card_label = QGraphicsTextItem(self)
@@ -393,7 +489,8 @@ class LinkItem(QGraphicsPathItem):
         font.setBold(True)
         font.setPointSize(9)
         self._card_label.setFont(font)
-        self._card_label.setDefaultTextColor(QColor("black"))
+        self._card_label.setDefaultTextColor(_LABEL_TEXT_COLOR)
+        self._card_text = None  # Last text set on the label, to skip re-layouts
 
         # Store points for curve calculation
         self._p1 = QPointF()
@@ -481,7 +578,10 @@ class LinkItem(QGraphicsPathItem):
             label_y = self._p1.y() + t * (self._p2.y() - self._p1.y())
 
         card_text = f"{self.link.cardinality_min},{self.link.cardinality_max}"
-        self._card_label.setPlainText(card_text)
+        if card_text != self._card_text:
+            # setPlainText re-lays out the text item, so only do it on change
+            self._card_label.setPlainText(card_text)
+            self._card_text = card_text
 
         # Get text bounding rect for background sizing
         text_rect = self._card_label.boundingRect()
@@ -503,14 +603,16 @@ class LinkItem(QGraphicsPathItem):
             label_y - text_rect.height() / 2
         )
 
-    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget = None):
-        if self.isSelected():
-            self.setPen(QPen(QColor(SELECTED_COLOR), 2))
-        else:
-            self.setPen(QPen(QColor(LinkItem.line_color), 1))
-        # Update cardinality box border color
-        self._card_bg.setPen(QPen(QColor(LinkItem.line_color), 1))
-        super().paint(painter, option, widget)
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.ItemSelectedHasChanged:
+            self.refresh_style()
+        return super().itemChange(change, value)
+
+    def refresh_style(self):
+        """Apply the pen for the current selection state and link color."""
+        self.setPen(_SELECTED_PEN if self.isSelected() else _pen(LinkItem.line_color, 1))
+        # Cardinality box border follows the link color
+        self._card_bg.setPen(_pen(LinkItem.line_color, 1))
 
     def cleanup(self):
         """Remove this link from connected items."""
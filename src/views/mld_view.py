@@ -18,6 +18,8 @@ class MLDView(QWidget):
     def __init__(self, project: Project, parent=None):
         super().__init__(parent)
         self._project = project
+        # source id -> ((table, overrides), tree item) from the last generation
+        self._table_items = {}
         self._setup_ui()
         self._connect_signals()
 
@@ -68,6 +70,16 @@ class MLDView(QWidget):
         font.setPointSize(10)
         self._tree.setFont(font)
 
+        # Brushes for different column types
+        self._pk_brush = QBrush(QColor("#1976D2"))  # Blue
+        self._fk_brush = QBrush(QColor("#F57C00"))  # Orange
+        self._regular_brush = QBrush(QColor("#333333"))  # Dark gray
+
+        # Table header font
+        self._table_font = QFont()
+        self._table_font.setBold(True)
+        self._table_font.setPointSize(11)
+
         layout.addWidget(self._tree)
 
         # Statistics label
@@ -130,99 +142,148 @@ class MLDView(QWidget):
         """Set a new project."""
         self._project = project
         self._tree.clear()
+        self._table_items.clear()
         self._stats_label.clear()
 
+    def _build_table_item(self, table, overrides) -> QTreeWidgetItem:
+        """Create the tree item for a table and its columns."""
+        pk_brush = self._pk_brush
+        fk_brush = self._fk_brush
+        regular_brush = self._regular_brush
+
+        table_item = QTreeWidgetItem()
+        table_item.setText(0, table.name.upper())
+        table_item.setText(1, f"({table.source_type})")
+
+        # Style table header
+        table_item.setFont(0, self._table_font)
+
+        if table.source_type == "association":
+            table_item.setForeground(0, fk_brush)
+        else:
+            table_item.setForeground(0, pk_brush)
+
+        column_items = []
+        for column in table.columns:
+            col_item = QTreeWidgetItem()
+
+            # Get display name (may be overridden)
+            original_name = column.name
+            display_name = overrides.get(original_name, original_name)
+
+            col_item.setText(0, display_name)
+            col_item.setData(0, Qt.UserRole, original_name)  # Store original for reference
+            col_item.setText(1, column.data_type)
+
+            # Build constraints string
+            constraints = []
+            if column.is_primary_key:
+                constraints.append("PK")
+            if column.is_foreign_key:
+                constraints.append("FK")
+            if not column.is_nullable:
+                constraints.append("NOT NULL")
+
+            col_item.setText(2, ", ".join(constraints))
+
+            # References
+            if column.references_table:
+                col_item.setText(3, f"→ {column.references_table}.{column.references_column}")
+
+            # Color based on type
+            if column.is_primary_key:
+                col_item.setForeground(0, pk_brush)
+                col_item.setForeground(2, pk_brush)
+            elif column.is_foreign_key:
+                col_item.setForeground(0, fk_brush)
+                col_item.setForeground(2, fk_brush)
+                col_item.setForeground(3, fk_brush)
+            else:
+                col_item.setForeground(0, regular_brush)
+
+            column_items.append(col_item)
+
+        table_item.addChildren(column_items)
+        return table_item
+
     def generate_mld(self):
-        """Generate and display the MLD."""
-        self._tree.clear()
+        """Generate and display the MLD.
 
-        transformer = MLDTransformer(self._project)
-        tables = transformer.transform()
+        Tables whose definition and column overrides are unchanged since the
+        last run keep their tree items; only new or changed tables are rebuilt.
+        """
+        project = self._project
+        tables = project.get_cached_mld(lambda: MLDTransformer(project).transform())
 
         if not tables:
+            self._tree.clear()
+            self._table_items.clear()
             self._stats_label.setText("No tables to display. Create entities in the MCD first.")
             return
 
-        # Colors for different column types
-        pk_color = QColor("#1976D2")  # Blue
-        fk_color = QColor("#F57C00")  # Orange
-        regular_color = QColor("#333333")  # Dark gray
-
-        table_count = 0
         column_count = 0
         pk_count = 0
         fk_count = 0
 
+        previous = self._table_items
+        current = {}
+        items = []
+        rebuilt = set()
         for table in tables:
-            table_count += 1
-
-            # Create table item
-            table_item = QTreeWidgetItem()
-            table_item.setText(0, table.name.upper())
-            table_item.setText(1, f"({table.source_type})")
-
-            # Style table header
-            bold_font = QFont()
-            bold_font.setBold(True)
-            bold_font.setPointSize(11)
-            table_item.setFont(0, bold_font)
+            overrides = self._project.get_mld_column_overrides(table.name.upper())
+            key = table.source_id or table.name
+            state = (table, overrides)
 
-            if table.source_type == "association":
-                table_item.setForeground(0, QBrush(fk_color))
+            cached = previous.get(key)
+            if cached is not None and cached[0] == state:
+                item = cached[1]
             else:
-                table_item.setForeground(0, QBrush(pk_color))
+                item = self._build_table_item(table, overrides)
+                rebuilt.add(len(items))
+            current[key] = (state, item)
+            items.append(item)
 
-            self._tree.addTopLevelItem(table_item)
-
-            # Add columns
+            column_count += len(table.columns)
             for column in table.columns:
-                column_count += 1
-                col_item = QTreeWidgetItem()
-
-                # Get display name (may be overridden)
-                original_name = column.name
-                display_name = self._project.get_mld_column_name(table.name.upper(), original_name)
-
-                col_item.setText(0, display_name)
-                col_item.setData(0, Qt.UserRole, original_name)  # Store original for reference
-                col_item.setText(1, column.data_type)
-
-                # Build constraints string
-                constraints = []
                 if column.is_primary_key:
-                    constraints.append("PK")
                     pk_count += 1
                 if column.is_foreign_key:
-                    constraints.append("FK")
                     fk_count += 1
-                if not column.is_nullable:
-                    constraints.append("NOT NULL")
-
-                col_item.setText(2, ", ".join(constraints) if constraints else "")
 
-                # References
-                if column.references_table:
-                    col_item.setText(3, f"→ {column.references_table}.{column.references_column}")
-
-                # Color based on type
-                if column.is_primary_key:
-                    col_item.setForeground(0, QBrush(pk_color))
-                    col_item.setForeground(2, QBrush(pk_color))
-                elif column.is_foreign_key:
-                    col_item.setForeground(0, QBrush(fk_color))
-                    col_item.setForeground(2, QBrush(fk_color))
-                    col_item.setForeground(3, QBrush(fk_color))
-                else:
-                    col_item.setForeground(0, QBrush(regular_color))
-
-                table_item.addChild(col_item)
-
-            # Expand table by default
-            table_item.setExpanded(True)
+        self._tree.setUpdatesEnabled(False)
+        self._tree.blockSignals(True)
+        try:
+            old_items = [
+                self._tree.topLevelItem(i)
+                for i in range(self._tree.topLevelItemCount())
+            ]
+            in_place = len(old_items) == len(items) and all(
+                old_items[i] is items[i]
+                for i in range(len(items)) if i not in rebuilt
+            )
+            if in_place:
+                # Same layout: swap out only the rows that changed
+                for index in rebuilt:
+                    self._tree.takeTopLevelItem(index)
+                    self._tree.insertTopLevelItem(index, items[index])
+                    items[index].setExpanded(True)
+            else:
+                # Tables added, removed or reordered: detach everything
+                # (reused items survive) and reinsert in the new order
+                while self._tree.topLevelItemCount():
+                    self._tree.takeTopLevelItem(0)
+                self._tree.addTopLevelItems(items)
+                # Expand tables by default
+                self._tree.expandAll()
+        finally:
+            self._tree.blockSignals(False)
+            self._tree.setUpdatesEnabled(True)
+
+        self._table_items = current
 
         # Update statistics
         self._stats_label.setText(
-            f"Tables: {table_count} | Columns: {column_count} | "
+            f"Tables: {len(tables)} | Columns: {column_count} | "
             f"Primary Keys: {pk_count} | Foreign Keys: {fk_count}"
         )
 
@@ -1,5 +1,7 @@
+import re
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
     QPushButton, QMessageBox, QFileDialog
 )
 from PySide6.QtCore import Qt
@@ -12,62 +14,59 @@ from ..controllers.sql_generator import SQLGenerator
 class SQLHighlighter(QSyntaxHighlighter):
     """Simple SQL syntax highlighter."""
 
-    KEYWORDS = [
+    KEYWORDS = frozenset([
         "CREATE", "TABLE", "PRIMARY", "KEY", "FOREIGN", "REFERENCES",
         "NOT", "NULL", "UNIQUE", "INDEX", "ALTER", "DROP", "INSERT",
         "INTO", "VALUES", "SELECT", "FROM", "WHERE", "AND", "OR",
         "INT", "INTEGER", "BIGINT", "SMALLINT", "VARCHAR", "CHAR",
         "TEXT", "BOOLEAN", "DATE", "TIME", "TIMESTAMP", "DECIMAL",
         "FLOAT", "DOUBLE", "SERIAL"
-    ]
+    ])
+
+    # Comments, strings and keywords in a single left-to-right pass, so a
+    # "--" inside a string or a quote inside a comment is not re-formatted.
+    # A keyword must not touch a letter or digit (underscore still separates).
+    _TOKEN_RE = re.compile(
+        r"(?P<comment>--.*)"
+        r"|(?P<string>'(?:[^']|'')*')"
+        r"|(?P<keyword>(?<![^\W_])(?:"
+        + "|".join(sorted(KEYWORDS, key=lambda k: (-len(k), k)))
+        + r")(?![^\W_]))",
+        re.IGNORECASE
+    )
+
+    # Shared by all highlighters, built with the first one
+    _TOKEN_FORMATS = None
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._keyword_format = QTextCharFormat()
-        self._keyword_format.setForeground(QColor("#0000FF"))
-        self._keyword_format.setFontWeight(QFont.Bold)
+        if SQLHighlighter._TOKEN_FORMATS is None:
+            SQLHighlighter._TOKEN_FORMATS = self._init_formats()
+
+    @staticmethod
+    def _init_formats() -> dict:
+        keyword_format = QTextCharFormat()
+        keyword_format.setForeground(QColor("#0000FF"))
+        keyword_format.setFontWeight(QFont.Bold)
 
-        self._comment_format = QTextCharFormat()
-        self._comment_format.setForeground(QColor("#008000"))
-        self._comment_format.setFontItalic(True)
+        comment_format = QTextCharFormat()
+        comment_format.setForeground(QColor("#008000"))
+        comment_format.setFontItalic(True)
 
-        self._string_format = QTextCharFormat()
-        self._string_format.setForeground(QColor("#A31515"))
+        string_format = QTextCharFormat()
+        string_format.setForeground(QColor("#A31515"))
+
+        return {
+            "comment": comment_format,
+            "string": string_format,
+            "keyword": keyword_format,
+        }
 
     def highlightBlock(self, text: str):
-        # Highlight keywords
-        for keyword in self.KEYWORDS:
-            index = 0
-            while True:
-                # Case-insensitive search
-                text_upper = text.upper()
-                idx = text_upper.find(keyword, index)
-                if idx == -1:
-                    break
-                # Check it's a whole word
-                before_ok = idx == 0 or not text[idx - 1].isalnum()
-                after_ok = (idx + len(keyword) >= len(text) or
-                           not text[idx + len(keyword)].isalnum())
-                if before_ok and after_ok:
-                    self.setFormat(idx, len(keyword), self._keyword_format)
-                index = idx + len(keyword)
-
-        # Highlight comments (-- style)
-        idx = text.find("--")
-        if idx >= 0:
-            self.setFormat(idx, len(text) - idx, self._comment_format)
-
-        # Highlight strings
-        in_string = False
-        start = 0
-        for i, char in enumerate(text):
-            if char == "'":
-                if not in_string:
-                    in_string = True
-                    start = i
-                else:
-                    self.setFormat(start, i - start + 1, self._string_format)
-                    in_string = False
+        formats = self._TOKEN_FORMATS
+        for match in self._TOKEN_RE.finditer(text):
+            start = match.start()
+            self.setFormat(start, match.end() - start, formats[match.lastgroup])
 
 
 class SQLView(QWidget):
@@ -76,6 +75,7 @@ class SQLView(QWidget):
     def __init__(self, project: Project, parent=None):
         super().__init__(parent)
         self._project = project
+        self._sql = ""  # Script currently displayed, written out by Export
         self._setup_ui()
 
     def _setup_ui(self):
@@ -97,9 +97,11 @@ class SQLView(QWidget):
         toolbar.addStretch()
         layout.addLayout(toolbar)
 
-        # SQL text editor
-        self._text_edit = QTextEdit()
+        # SQL text editor (plain text: no rich-text parsing, cheaper layout)
+        self._text_edit = QPlainTextEdit()
         self._text_edit.setReadOnly(True)
+        self._text_edit.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self._text_edit.setUndoRedoEnabled(False)
         font = QFont("Monospace")
         font.setStyleHint(QFont.Monospace)
         font.setPointSize(10)
@@ -113,13 +115,19 @@ class SQLView(QWidget):
     def set_project(self, project: Project):
         """Set a new project."""
         self._project = project
+        self._sql = ""
         self._text_edit.clear()
 
     def generate_sql(self):
         """Generate SQL from the current project."""
-        generator = SQLGenerator(self._project)
-        sql = generator.generate()
+        project = self._project
+        sql = project.get_cached_sql(lambda: SQLGenerator(project).generate())
+        # Detach the highlighter while the text is replaced, so it runs one
+        # pass over the final document when reattached
+        self._highlighter.setDocument(None)
         self._text_edit.setPlainText(sql)
+        self._highlighter.setDocument(self._text_edit.document())
+        self._sql = sql
 
     def _copy_to_clipboard(self):
         """Copy SQL to clipboard."""
@@ -133,8 +141,8 @@ class SQLView(QWidget):
 
     def _export_to_file(self):
         """Export SQL to a file."""
-        text = self._text_edit.toPlainText()
-        if not text:
+        sql = self._sql
+        if not sql:
             QMessageBox.warning(self, "Empty", "No SQL to export. Generate SQL first.")
             return
 
@@ -147,8 +155,9 @@ class SQLView(QWidget):
 
         if file_path:
             try:
+                # Export exactly what is displayed, even if the model changed since
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(text)
+                    f.write(sql)
                 QMessageBox.information(
                     self, "Exported",
                     f"SQL exported to:\n{file_path}"
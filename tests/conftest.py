@@ -0,0 +1,94 @@
+"""Shared fixtures for the test suite."""
+
+import dataclasses
+
+import pytest
+from src.models import Attribute, Entity, Association, Link, Project
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    pytest_benchmark = None
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "parallel_safe: test keeps no shared mutable state (safe to shard with xdist)"
+    )
+    config.addinivalue_line(
+        "markers", "model_unit: unit test of a single data model (select with -m model_unit)"
+    )
+    config.addinivalue_line(
+        "markers", "perf: micro-benchmark of a model hot path (select with -m perf)"
+    )
+
+
+if pytest_benchmark is None:
+    def pytest_addoption(parser):
+        # Accept the plugin's switches (pytest.ini passes --benchmark-disable)
+        group = parser.getgroup("benchmark")
+        group.addoption("--benchmark-disable", action="store_true")
+        group.addoption("--benchmark-enable", action="store_true")
+
+    @pytest.fixture
+    def benchmark():
+        """Stand-in for pytest-benchmark's fixture: runs the target once, untimed."""
+        def run(func, *args, **kwargs):
+            return func(*args, **kwargs)
+        return run
+
+
+@pytest.fixture(scope="session")
+def pk_int_attr():
+    """Shared INT primary key attribute (read-only: do not mutate)."""
+    return Attribute(name="id", data_type="INT", is_primary_key=True)
+
+
+# Prototype for make_attr; never handed out itself
+_BASE_ATTR = Attribute(name="x", data_type="INT")
+
+
+@pytest.fixture
+def make_attr():
+    """Factory for fresh attributes, defaulting to a plain INT column."""
+    def make(**kwargs):
+        return dataclasses.replace(_BASE_ATTR, **kwargs)
+    return make
+
+
+@pytest.fixture
+def make_entity():
+    """Factory for fresh entities."""
+    def make(name="Test", attributes=None, **kwargs):
+        return Entity(name=name, attributes=list(attributes or []), **kwargs)
+    return make
+
+
+@pytest.fixture
+def empty_project():
+    """A new, empty project."""
+    return Project()
+
+
+@pytest.fixture(scope="session")
+def sample_project_data():
+    """Serialized Client -(1,N)- Passer project, built once per session.
+
+    Read-only: tests needing a mutable project call Project.from_dict() on it.
+    """
+    project = Project()
+    entity = Entity(
+        name="Client",
+        attributes=[Attribute(name="id_client", data_type="INT", is_primary_key=True)],
+        x=100, y=100
+    )
+    project.add_entity(entity)
+    assoc = Association(name="Passer", x=200, y=100)
+    project.add_association(assoc)
+    project.add_link(Link(
+        entity_id=entity.id,
+        association_id=assoc.id,
+        cardinality_min="1",
+        cardinality_max="N"
+    ))
+    return project.to_dict()
@@ -0,0 +1,23 @@
+"""Tests for the Association model."""
+
+import pytest
+from src.models import Association
+
+pytestmark = [pytest.mark.parallel_safe, pytest.mark.model_unit]
+
+
+class TestAssociation:
+    """Tests for Association model."""
+
+    def test_create_association(self):
+        assoc = Association(name="Passer")
+        assert assoc.name == "Passer"
+        assert len(assoc.attributes) == 0
+        assert assoc.id
+
+    def test_carrying_attributes(self, make_attr):
+        attr = make_attr(name="quantite")
+        assoc = Association(name="Contenir", attributes=[attr])
+        assert assoc.has_attributes() is True
+        assoc.remove_attribute("quantite")
+        assert assoc.has_attributes() is False
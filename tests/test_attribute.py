@@ -0,0 +1,48 @@
+"""Tests for the Attribute model."""
+
+import pytest
+from src.models import Attribute
+
+pytestmark = [pytest.mark.parallel_safe, pytest.mark.model_unit]
+
+# Recurring attribute shapes
+_ID_PK = {"name": "id", "data_type": "INT", "is_primary_key": True}
+
+
+class TestAttribute:
+    """Tests for Attribute model."""
+
+    @pytest.mark.parametrize("kwargs,sql,pk", [
+        (_ID_PK, "INT", True),
+        (dict(name="nom", data_type="VARCHAR", size=100), "VARCHAR(100)", False),
+    ])
+    def test_attribute_shapes(self, kwargs, sql, pk):
+        attr = Attribute(**kwargs)
+        assert attr.name == kwargs["name"]
+        assert attr.size == kwargs.get("size")
+        assert attr.get_sql_type() == sql and attr.is_primary_key is pk
+
+    def test_to_dict_and_from_dict(self):
+        attr = Attribute(name="email", data_type="VARCHAR", size=255, is_primary_key=False)
+        data = attr.to_dict()
+        restored = Attribute.from_dict(data)
+        assert restored == attr
+
+    def test_attribute_to_dict_golden(self):
+        data = Attribute(**_ID_PK).to_dict()
+        assert data == {"name": "id", "type": "INT", "size": None, "pk": True}
+        assert list(data) == ["name", "type", "size", "pk"]
+
+    def test_attribute_uses_slots(self):
+        attr = Attribute(name="x", data_type="INT")
+        assert not hasattr(attr, "__dict__")  # Holds for mypyc-compiled builds too
+        with pytest.raises(AttributeError):
+            attr.random_field = 1
+
+    def test_sql_type_follows_changes(self):
+        attr = Attribute(name="code", data_type="VARCHAR", size=10)
+        assert attr.get_sql_type() == "VARCHAR(10)"
+        attr.size = 20
+        assert attr.get_sql_type() == "VARCHAR(20)"
+        attr.data_type = "INT"
+        assert attr.get_sql_type() == "INT"
@@ -0,0 +1,30 @@
+"""Micro-benchmarks for model hot paths.
+
+Benchmarks are disabled by default (pytest.ini), so each case runs once,
+untimed. To time them, install pytest-benchmark (requirements-dev.txt) and run
+``pytest -m perf --benchmark-enable``. Without the plugin they still run once
+as smoke tests (see conftest.py).
+"""
+
+import pytest
+from src.models import Attribute, Entity, Project
+
+pytestmark = pytest.mark.perf
+
+
+def test_attribute_ctor_perf(benchmark):
+    benchmark(Attribute, name="id", data_type="INT", is_primary_key=True)
+
+
+def test_entity_ctor_perf(benchmark):
+    attrs = [Attribute(name=f"a{i}", data_type="INT") for i in range(20)]
+    benchmark(Entity, name="Client", attributes=attrs)
+
+
+def test_project_to_dict_perf(benchmark, sample_project_data):
+    project = Project.from_dict(sample_project_data)
+    benchmark(project.to_dict)
+
+
+def test_project_from_dict_perf(benchmark, sample_project_data):
+    benchmark(Project.from_dict, sample_project_data)
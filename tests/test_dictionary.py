@@ -0,0 +1,45 @@
+"""Tests for the Dictionary model."""
+
+import pytest
+from src.models import Attribute, Dictionary
+
+pytestmark = [pytest.mark.parallel_safe, pytest.mark.model_unit]
+
+# Recurring attribute shapes
+_ID_INT = {"name": "id", "data_type": "INT"}
+
+
+class TestDictionary:
+    """Tests for Dictionary model (legacy, still used for backward compatibility)."""
+
+    def test_add_and_get_attribute(self, pk_int_attr):
+        dictionary = Dictionary()
+        assert dictionary.add_attribute(pk_int_attr) is True
+        assert dictionary.get_attribute("id") == pk_int_attr
+        assert len(dictionary) == 1
+
+    def test_duplicate_attribute_rejected(self, make_attr):
+        dictionary = Dictionary()
+        attr1 = make_attr(**_ID_INT)
+        attr2 = make_attr(name="id", data_type="VARCHAR", size=50)
+        assert dictionary.add_attribute(attr1) is True
+        assert dictionary.add_attribute(attr2) is False
+        assert len(dictionary) == 1
+
+    def test_update_attribute(self, make_attr):
+        dictionary = Dictionary()
+        attr = make_attr(name="old_name")
+        dictionary.add_attribute(attr)
+
+        new_attr = make_attr(name="new_name", data_type="VARCHAR", size=100)
+        assert dictionary.update_attribute("old_name", new_attr) is True
+        assert dictionary.get_attribute("old_name") is None
+        assert dictionary.get_attribute("new_name") == new_attr
+
+    @pytest.mark.parametrize("n", [10, 100, 1000])
+    def test_bulk_add_scaling(self, n):
+        dictionary = Dictionary()
+        for i in range(n):
+            assert dictionary.add_attribute(Attribute(name=f"a{i}", data_type="INT"))
+        assert len(dictionary) == n
+        assert dictionary.add_attribute(Attribute(name="a0", data_type="INT")) is False
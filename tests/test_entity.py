@@ -0,0 +1,97 @@
+"""Tests for the Entity model."""
+
+import uuid
+
+import pytest
+from src.models import Attribute, Entity
+
+pytestmark = [pytest.mark.parallel_safe, pytest.mark.model_unit]
+
+
+class TestEntity:
+    """Tests for Entity model."""
+
+    def test_create_entity(self, make_attr, make_entity):
+        attr1 = make_attr(name="id_client", is_primary_key=True)
+        attr2 = make_attr(name="nom", data_type="VARCHAR", size=100)
+        entity = make_entity("Client", [attr1, attr2])
+        assert entity.name == "Client"
+        assert len(entity.attributes) == 2
+        assert uuid.UUID(entity.id).hex == entity.id  # 128-bit hex id should be generated
+
+    def test_add_remove_attribute(self):
+        entity = Entity(name="Produit")
+        entity.add_attribute(Attribute(name="id_produit", data_type="INT", is_primary_key=True))
+        entity.add_attribute(Attribute(name="libelle", data_type="VARCHAR", size=100))
+        assert len(entity.attributes) == 2
+
+        entity.remove_attribute("libelle")
+        assert len(entity.attributes) == 1
+        assert entity.get_attribute("id_produit") is not None
+
+    def test_remove_scaling(self):
+        attrs = [Attribute(name=f"a{i}", data_type="INT") for i in range(1000)]
+        entity = Entity(name="X", attributes=attrs)
+        for i in range(1000):
+            entity.remove_attribute(f"a{i}")
+        assert not entity.attributes
+
+    def test_duplicate_attribute_names_keep_first(self):
+        with pytest.warns(UserWarning, match="Duplicate attribute 'a'"):
+            entity = Entity(name="X", attributes=[Attribute(name="a", data_type="INT"),
+                                                  Attribute(name="a", data_type="DATE")])
+        assert [attr.data_type for attr in entity.iter_attributes()] == ["INT"]
+
+        with pytest.warns(UserWarning):
+            entity.attributes = [Attribute(name="b", data_type="INT"),
+                                 Attribute(name="b", data_type="DATE")]
+        assert entity.get_attribute("b").data_type == "INT"
+
+        with pytest.warns(UserWarning):
+            assert entity.add_attribute(Attribute(name="b", data_type="DATE")) is False
+        assert entity.add_attribute(Attribute(name="c", data_type="DATE")) is True
+        assert entity.get_attribute("b").data_type == "INT"
+
+    def test_from_dict_with_legacy_duplicates(self):
+        data = Entity(name="X", attributes=[Attribute(name="a", data_type="INT")]).to_dict()
+        data["attributes"].append({"name": "a", "type": "DATE"})
+        with pytest.warns(UserWarning):
+            entity = Entity.from_dict(data)
+        assert entity.attribute_count() == 1
+
+    def test_equality_is_order_sensitive(self):
+        a, b = Attribute(name="a", data_type="INT"), Attribute(name="b", data_type="INT")
+        first = Entity(name="X", attributes=[a, b], id="e1")
+        assert first == Entity(name="X", attributes=[a, b], id="e1")
+        assert first != Entity(name="X", attributes=[b, a], id="e1")
+
+    def test_attributes_are_read_only(self):
+        entity = Entity(name="X", attributes=[Attribute(name="a", data_type="INT")])
+        with pytest.raises(AttributeError):
+            entity.attributes.append(Attribute(name="b", data_type="INT"))
+        assert "_attributes" not in repr(entity)
+        assert "attributes=(Attribute(name='a'" in repr(entity)
+
+    def test_bulk_extend(self):
+        entity = Entity(name="X")
+        attrs = [Attribute(name=f"a{i}", data_type="INT") for i in range(500)]
+        assert entity.extend_attributes(attrs) == 500
+        assert entity.attributes == tuple(attrs)
+        with pytest.warns(UserWarning):
+            assert entity.extend_attributes([Attribute(name="a0", data_type="DATE")]) == 0
+        assert (entity.attribute_count(), entity.get_attribute("a0").data_type) == (500, "INT")
+
+    def test_to_dict_and_from_dict(self):
+        attr = Attribute(name="id_cmd", data_type="INT", is_primary_key=True)
+        entity = Entity(name="Commande", attributes=[attr], x=100, y=200)
+        data = entity.to_dict()
+        restored = Entity.from_dict(data)
+        assert restored == entity
+        assert restored.attributes == (attr,)
+
+    def test_get_primary_keys(self, pk_int_attr, make_attr, make_entity):
+        attr2 = make_attr(name="nom", data_type="VARCHAR", size=100)
+        entity = make_entity("Test", [pk_int_attr, attr2])
+        pks = entity.get_primary_keys()
+        assert len(pks) == 1
+        assert pks[0].name == "id"
@@ -0,0 +1,55 @@
+"""Tests for project file save/load."""
+
+import os
+
+import pytest
+from src.models import Attribute, Entity, Project
+from src.models import project as project_module
+from src.utils import file_io
+from src.utils.file_io import FileIO
+
+
+@pytest.fixture
+def project():
+    project = Project()
+    project.add_entity(Entity(
+        name="Étudiant",
+        attributes=[Attribute(name="id", data_type="INT", is_primary_key=True)]
+    ))
+    return project
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run a test with orjson (if installed) and with the stdlib json fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        # Behave as if orjson were not installed, for both saving and loading
+        monkeypatch.setattr(file_io, "orjson", None)
+        monkeypatch.setattr(project_module, "orjson", None)
+    return request.param
+
+
+def test_save_and_load_roundtrip(project, backend, tmp_path):
+    path = tmp_path / "model.merisio"
+    assert FileIO.save_project(project, str(path)) is True
+    assert project.modified is False
+
+    loaded = FileIO.load_project(str(path))
+    assert loaded.get_all_entities() == project.get_all_entities()
+    assert os.listdir(tmp_path) == ["model.merisio"]  # No temp file left behind
+
+
+def test_failed_save_keeps_existing_file(project, backend, tmp_path, monkeypatch):
+    path = tmp_path / "model.merisio"
+    assert FileIO.save_project(project, str(path)) is True
+    original = path.read_bytes()
+
+    def broken_to_dict(self):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(Entity, "to_dict", broken_to_dict)
+    assert FileIO.save_project(project, str(path)) is False
+    assert path.read_bytes() == original
+    assert os.listdir(tmp_path) == ["model.merisio"]
@@ -0,0 +1,25 @@
+"""Tests for the Link model."""
+
+import pytest
+from src.models import Link
+
+pytestmark = [pytest.mark.parallel_safe, pytest.mark.model_unit]
+
+
+class TestLink:
+    """Tests for Link model."""
+
+    @pytest.mark.parametrize("mn,mx,card,mult,mand", [
+        ("1", "N", "1,N", True, True),
+        ("0", "1", "0,1", False, False),
+        ("0", "N", "0,N", True, False),
+        ("1", "1", "1,1", False, True),
+    ])
+    def test_cardinality(self, mn, mx, card, mult, mand):
+        link = Link(
+            entity_id="e1",
+            association_id="a1",
+            cardinality_min=mn,
+            cardinality_max=mx
+        )
+        assert (link.cardinality, link.is_multiple(), link.is_mandatory()) == (card, mult, mand)
@@ -0,0 +1,299 @@
+"""Tests for the Project model."""
+
+import pytest
+from src.models import Attribute, Entity, Association, Link, Project
+
+pytestmark = [pytest.mark.parallel_safe, pytest.mark.model_unit]
+
+# Recurring attribute shapes
+_ID_INT = {"name": "id", "data_type": "INT"}
+
+
+@pytest.fixture(scope="module")
+def roundtripped_project(sample_project_data):
+    """(restored, original) pair from one to_dict/from_dict round-trip (read-only)."""
+    original = Project.from_dict(sample_project_data)
+    return Project.from_dict(original.to_dict()), original
+
+
+class TestProject:
+    """Tests for Project model."""
+
+    def test_create_empty_project(self):
+        p = Project()
+        ents, assocs, links, attrs = (p.get_all_entities(), p.get_all_associations(),
+                                      p.get_all_links(), p.get_all_attributes())
+        assert not (ents or assocs or links or attrs)
+
+    def test_add_entity(self, empty_project, make_entity):
+        project = empty_project
+        entity = make_entity("Client")
+        project.add_entity(entity)
+        assert (len(project.get_all_entities()), project.get_entity(entity.id),
+                project.modified) == (1, entity, True)
+
+    def test_remove_entity_removes_links(self, sample_project_data):
+        project = Project.from_dict(sample_project_data)
+        entity_id = sample_project_data["mcd"]["entities"][0]["id"]
+
+        assert len(project.get_all_links()) == 1
+
+        project.remove_entity(entity_id)
+        # Link should be removed too
+        assert (len(project.get_all_entities()), len(project.get_all_links())) == (0, 0)
+
+    def test_serialization(self, sample_project_data, roundtripped_project):
+        mcd = sample_project_data["mcd"]
+        entity_data = mcd["entities"][0]
+        assert entity_data["name"] == "Client"
+        assert entity_data["attributes"][0]["name"] == "id_client"
+        assert mcd["links"][0]["entity_id"] == entity_data["id"]
+
+        restored, original = roundtripped_project
+        restored_entity = restored.get_all_entities()[0]
+        assert restored_entity.name == "Client"
+        assert restored_entity.id == entity_data["id"]
+        assert len(restored_entity.attributes) == 1
+        assert restored_entity.attributes[0].name == "id_client"
+        assert restored.to_dict()["mcd"] == original.to_dict()["mcd"] == mcd
+
+    @pytest.mark.parametrize("getter,expected", [
+        ("get_all_entities", 1),
+        ("get_all_associations", 1),
+        ("get_all_links", 1),
+        ("get_all_attributes", 1),
+    ])
+    def test_roundtrip_counts(self, roundtripped_project, getter, expected):
+        restored, _ = roundtripped_project
+        assert len(getattr(restored, getter)()) == expected
+
+    def test_to_dict_stamps_modified_at_only_when_modified(self):
+        project = Project()
+        project.modified_at = "2020-01-01T00:00:00"
+        assert project.to_dict()["metadata"]["modified_at"] == "2020-01-01T00:00:00"
+
+        project.add_entity(Entity(name="Client"))
+        assert project.to_dict()["metadata"]["modified_at"] != "2020-01-01T00:00:00"
+
+    def test_mld_overrides_roundtrip(self):
+        project = Project()
+        project.set_mld_column_name("CLIENT", "id_client", "client_id")
+        assert project.get_mld_column_name("CLIENT", "id_client") == "client_id"
+        assert project.get_mld_column_name("CLIENT", "nom") == "nom"
+
+        data = project.to_dict()
+        assert data["mld"]["column_overrides"] == {"CLIENT.id_client": "client_id"}
+
+        restored = Project.from_dict(data)
+        assert restored.get_mld_column_name("CLIENT", "id_client") == "client_id"
+        assert restored.get_mld_column_overrides("CLIENT") == {"id_client": "client_id"}
+        assert restored.get_mld_column_overrides("COMMANDE") == {}
+
+        project.set_mld_column_name("CLIENT", "id_client", "id_client")
+        assert project.get_all_mld_overrides() == {}
+
+    def test_get_all_attributes(self, empty_project, pk_int_attr, make_attr, make_entity):
+        project = empty_project
+
+        attr2 = make_attr(name="nom", data_type="VARCHAR", size=100)
+        entity = make_entity("Client", [pk_int_attr, attr2])
+        project.add_entity(entity)
+
+        all_attrs = project.get_all_attributes()
+        # (count, entity name, first attribute name)
+        assert (len(all_attrs), all_attrs[0][0], all_attrs[0][1].name) == (2, "Client", "id")
+
+    def test_get_all_attributes_cached(self):
+        project = Project()
+        project.add_entity(Entity(name="C", attributes=[Attribute(**_ID_INT)]))
+        first = project.get_all_attributes()
+        assert project.get_all_attributes() is first
+
+        project.add_entity(Entity(name="D"))
+        assert project.get_all_attributes() is not first
+
+    def test_get_all_attributes_cache_invalidation(self):
+        project = Project()
+        entity = Entity(name="Client", attributes=[Attribute(**_ID_INT)])
+        project.add_entity(entity)
+        assert len(project.get_all_attributes()) == 1
+
+        entity.add_attribute(Attribute(name="nom", data_type="VARCHAR", size=50))
+        project.notify_entity_changed(entity.id)
+        assert len(project.get_all_attributes()) == 2
+
+        project.rename_entity(entity.id, "Customer")
+        assert project.get_all_attributes()[0][0] == "Customer"
+
+        project.remove_entity(entity.id)
+        assert project.get_all_attributes() == []
+
+    def test_counts(self):
+        project = Project()
+        entity = Entity(name="Client", attributes=[Attribute(**_ID_INT)])
+        project.add_entity(entity)
+        assoc = Association(name="Passer")
+        project.add_association(assoc)
+        project.add_link(Link(entity_id=entity.id, association_id=assoc.id))
+
+        assert project.entity_count() == 1
+        assert project.association_count() == 1
+        assert project.link_count() == 1
+        assert project.attribute_count() == 1
+        project.get_all_attributes()
+        assert project.attribute_count() == 1
+
+    def test_link_lookups_follow_add_and_remove(self):
+        project = Project()
+        client = Entity(name="Client")
+        commande = Entity(name="Commande")
+        project.add_entity(client)
+        project.add_entity(commande)
+        assoc = Association(name="Passer")
+        project.add_association(assoc)
+
+        link1 = Link(entity_id=client.id, association_id=assoc.id)
+        link2 = Link(entity_id=commande.id, association_id=assoc.id)
+        project.add_link(link1)
+        project.add_link(link2)
+        assert project.get_links_for_entity(client.id) == [link1]
+        assert project.get_links_for_association(assoc.id) == [link1, link2]
+
+        project.remove_link(link1.id)
+        assert project.get_links_for_entity(client.id) == []
+        assert project.get_links_for_association(assoc.id) == [link2]
+
+        project.remove_association(assoc.id)
+        assert project.get_links_for_entity(commande.id) == []
+        assert len(project.get_all_links()) == 0
+
+    def test_get_entity_by_name_after_rename(self):
+        project = Project()
+        entity = Entity(name="Client")
+        project.add_entity(entity)
+        assert project.get_entity_by_name("Client") is entity
+
+        entity.name = "Customer"  # Renamed in place, as the entity dialog does
+        assert project.get_entity_by_name("Customer") is entity
+        assert project.get_entity_by_name("Client") is None
+
+        entity.name = "Client"  # Old name first this time
+        assert project.get_entity_by_name("Client") is entity
+        assert project.get_entity_by_name("Customer") is None
+
+    def test_get_entity_by_name_with_duplicates(self):
+        project = Project()
+        first = Entity(name="Client")
+        second = Entity(name="Client")
+        project.add_entity(first)
+        project.add_entity(second)
+        assert project.get_entity_by_name("Client") is first
+        assert project.get_entity_by_name("Missing") is None
+
+        project.remove_entity(first.id)
+        assert project.get_entity_by_name("Client") is second
+
+        project.add_entity(first)
+        project.rename_entity(second.id, "Customer")
+        assert project.get_entity_by_name("Client") is first
+        assert project.get_entity_by_name("Customer") is second
+
+    def test_rename_entity(self):
+        project = Project()
+        entity = Entity(name="Client")
+        project.add_entity(entity)
+        project.modified = False
+
+        project.rename_entity(entity.id, "Customer")
+        assert entity.name == "Customer"
+        assert project.get_entity_by_name("Customer") is entity
+        assert project.get_entity_by_name("Client") is None
+        assert project.modified is True
+
+    def test_clear_resets_lookups(self):
+        project = Project()
+        entity = Entity(name="Client", attributes=[Attribute(**_ID_INT)])
+        project.add_entity(entity)
+        assoc = Association(name="Passer")
+        project.add_association(assoc)
+        project.add_link(Link(entity_id=entity.id, association_id=assoc.id))
+        assert len(project.get_all_attributes()) == 1
+
+        project.clear()
+        assert project.get_entity_by_name("Client") is None
+        assert project.get_links_for_entity(entity.id) == []
+        assert project.get_links_for_association(assoc.id) == []
+        assert project.get_all_attributes() == []
+
+    def test_mcd_version_bumps(self):
+        project = Project()
+        entity = Entity(name="Client")
+        version = project.mcd_version
+
+        project.add_entity(entity)
+        assert project.mcd_version > version
+        version = project.mcd_version
+
+        project.rename_entity(entity.id, "Customer")
+        assert project.mcd_version > version
+        version = project.mcd_version
+
+        assoc = Association(name="Passer")
+        project.add_association(assoc)
+        link = Link(entity_id=entity.id, association_id=assoc.id)
+        project.add_link(link)
+        version = project.mcd_version
+        project.remove_link(link.id)
+        assert project.mcd_version > version
+
+    def test_cached_mld_and_sql(self):
+        project = Project()
+        project.add_entity(Entity(name="Client"))
+        calls = []
+
+        def build(result):
+            def builder():
+                calls.append(result)
+                return result
+            return builder
+
+        tables = project.get_cached_mld(build(["t"]))
+        assert project.get_cached_mld(build(["other"])) is tables
+        assert project.get_cached_sql(build("sql")) == "sql"
+        assert calls == [["t"], "sql"]
+
+        # Column renames only affect the SQL
+        project.set_mld_column_name("CLIENT", "id", "client_id")
+        assert project.get_cached_mld(build(["other"])) is tables
+        assert project.get_cached_sql(build("renamed")) == "renamed"
+
+
+        project.notify_mcd_changed()
+        assert project.get_cached_sql(build("new sql")) == "new sql"
+        assert project.get_cached_mld(build(["new"])) == ["new"]
+
+    def test_notify_mcd_changed_drops_attribute_cache(self):
+        project = Project()
+        entity = Entity(name="Client", attributes=[Attribute(**_ID_INT)])
+        project.add_entity(entity)
+        first = project.get_all_attributes()
+
+        project.notify_mcd_changed()
+        assert project.get_all_attributes() is not first
+
+    def test_orjson_roundtrip(self, sample_project_data):
+        orjson = pytest.importorskip("orjson")
+        blob = orjson.dumps(sample_project_data)
+        assert orjson.loads(blob) == sample_project_data
+
+    def test_from_json_bytes(self):
+        import json
+
+        project = Project()
+        entity = Entity(name="Client", attributes=[Attribute(**_ID_INT)])
+        project.add_entity(entity)
+
+        blob = json.dumps(project.to_dict()).encode("utf-8")
+        restored = Project.from_json_bytes(blob)
+        assert restored.get_entity_by_name("Client").id == entity.id
+        assert restored.modified is False
@@ -1,11 +1,7 @@
 """Tests for SQL generator."""
 
 import pytest
-from src.models.attribute import Attribute
-from src.models.entity import Entity
-from src.models.association import Association
-from src.models.link import Link
-from src.models.project import Project
+from src.models import Attribute, Entity, Association, Link, Project
 from src.controllers.sql_generator import SQLGenerator
 
 
@@ -104,6 +100,14 @@ class TestSQLGenerator:
         assert "note DECIMAL(5)" in sql  # Carrying attribute
         assert "FOREIGN KEY" in sql
 
+    def test_generate_iter_matches_generate(self, n_n_relationship_project):
+        """Test that the streamed script is identical to the full one."""
+        generator = SQLGenerator(n_n_relationship_project)
+        chunks = list(generator.generate_iter())
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == generator.generate()
+
     def test_safe_name_conversion(self, simple_project):
         """Test that names are converted to safe SQL identifiers."""
         generator = SQLGenerator(simple_project)